@@ -0,0 +1,151 @@
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import statistics
+import warnings
+
+from ollama_stub import start_stub
+from view_latency import ROOT
+
+# Kører uden sprogmodel (kun CPU), fx i CI:
+#   python benchmarks/chatbot_latency.py --max-context-p95-ms 200 --max-lookup-p95-ms 50
+# eller mod en rigtig server med --host http://localhost:11434
+QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chatbot_questions.txt")
+
+
+def load_questions(path=QUESTIONS_PATH):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))] if values else 0.0
+
+
+# ----------------------------------
+# Hele chatbot-kæden for ét spørgsmål, delt op i faser.
+# ask_chatbot_about_data er en join af stream_chatbot_answer, så streamen
+# måles direkte for også at få tiden til første token.
+# ----------------------------------
+def time_question(chatbot_logic, question, stub_state):
+    from utils.perf import start_rerun, rerun_summary
+
+    sent = len(stub_state.stats()["requests"]) if stub_state else 0
+    start_rerun()
+    start = time.perf_counter()
+    first = None
+    parts = []
+    for chunk in chatbot_logic.stream_chatbot_answer(question):
+        if first is None:
+            first = time.perf_counter() - start
+        parts.append(chunk)
+    total = time.perf_counter() - start
+
+    spans = {row["Span"]: row["Total (ms)"] for _, row in rerun_summary()["spans"].iterrows()}
+    requests = stub_state.stats()["requests"][sent:] if stub_state else []
+    routed = not requests and "chatbot: context" not in spans
+    route_ms = spans.get("chatbot: route", 0.0)
+    context_ms = spans.get("chatbot: context", 0.0)
+    return {
+        "question": question,
+        "path": "lookup" if routed else "llm",
+        "total_ms": total * 1000,
+        "first_token_ms": (first or total) * 1000,
+        "route_ms": route_ms,
+        "context_ms": context_ms,
+        "generation_ms": max(0.0, total * 1000 - route_ms - context_ms),
+        "prompt_chars": sum(r["prompt_chars"] for r in requests),
+        "new_prompt_chars": sum(r["new_prompt_chars"] for r in requests),
+        "answer_chars": len("".join(parts)),
+    }
+
+
+def summarize(results):
+    summary = {}
+    for path in ("lookup", "llm"):
+        rows = [r for r in results if r["path"] == path]
+        if not rows:
+            continue
+        summary[path] = {"questions": len(rows)}
+        for field in ("total_ms", "first_token_ms", "route_ms", "context_ms", "generation_ms", "prompt_chars"):
+            values = [r[field] for r in rows]
+            summary[path][field] = {"p50": statistics.median(values), "p95": _percentile(values, 0.95)}
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end chatbot latency on a fixed question set against a local Ollama stand-in")
+    parser.add_argument("--questions", default=QUESTIONS_PATH)
+    parser.add_argument("--host", help="use a real Ollama server instead of the stand-in")
+    parser.add_argument("--token-seconds", type=float, default=0.005, help="stand-in time per token")
+    parser.add_argument("--latency-seconds", type=float, default=0.05, help="stand-in delay before the first token")
+    parser.add_argument("--prompt-chars-per-second", type=float, default=50000, help="stand-in prompt processing rate")
+    parser.add_argument("--reply-tokens", type=int, default=60, help="stand-in answer length")
+    parser.add_argument("--warm-cache", action="store_true", help="keep the answer cache between questions")
+    parser.add_argument("--max-context-p95-ms", type=float, help="fail if context building p95 exceeds this")
+    parser.add_argument("--max-lookup-p95-ms", type=float, help="fail if direct lookup answers p95 exceeds this")
+    parser.add_argument("--output", help="optional JSON report")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    server, stub_state = None, None
+    if args.host:
+        os.environ["OLLAMA_HOST"] = args.host
+    else:
+        server, stub_state, url = start_stub(load_seconds=0, token_seconds=args.token_seconds,
+                                             latency_seconds=args.latency_seconds,
+                                             prompt_chars_per_second=args.prompt_chars_per_second,
+                                             reply_tokens=args.reply_tokens)
+        os.environ["OLLAMA_HOST"] = url
+
+    import chatbot_logic
+    from utils import answer_cache
+
+    questions = load_questions(args.questions)
+    start = time.perf_counter()
+    chatbot_logic.get_fact_index()
+    print(f"context snapshot + fact index: {(time.perf_counter() - start) * 1000:.0f} ms ({len(questions)} questions)")
+
+    results = []
+    for question in questions:
+        if not args.warm_cache:
+            answer_cache.clear_answers()
+        results.append(time_question(chatbot_logic, question, stub_state))
+
+    summary = summarize(results)
+    print(f"{'path':<8}{'n':>4}  {'phase':<16}{'p50':>10}{'p95':>10}")
+    for path, stats in summary.items():
+        for field in ("total_ms", "first_token_ms", "route_ms", "context_ms", "generation_ms", "prompt_chars"):
+            unit = " ch" if field == "prompt_chars" else " ms"
+            print(f"{path:<8}{stats['questions']:>4}  {field[:-3] if unit == ' ms' else field:<16}"
+                  f"{stats[field]['p50']:>8.1f}{unit}{stats[field]['p95']:>7.1f}{unit}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "questions": results}, f, indent=2, ensure_ascii=False)
+
+    failures = []
+    llm = summary.get("llm")
+    if args.max_context_p95_ms is not None and llm and llm["context_ms"]["p95"] > args.max_context_p95_ms:
+        failures.append(f"context building p95 {llm['context_ms']['p95']:.1f} ms > {args.max_context_p95_ms} ms")
+    lookup = summary.get("lookup")
+    if args.max_lookup_p95_ms is not None and lookup and lookup["total_ms"]["p95"] > args.max_lookup_p95_ms:
+        failures.append(f"lookup answers p95 {lookup['total_ms']['p95']:.1f} ms > {args.max_lookup_p95_ms} ms")
+
+    if server is not None:
+        server.shutdown()
+    for line in failures:
+        print("FAIL", line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
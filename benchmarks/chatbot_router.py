@@ -0,0 +1,76 @@
+import os
+import sys
+import argparse
+import logging
+import warnings
+
+from chatbot_latency import QUESTIONS_PATH
+from view_latency import ROOT
+
+# Tjek af opslags-routeren uden sprogmodel (kun data), fx i CI:
+#   python benchmarks/chatbot_router.py
+# Spørgsmål der ligner opslag, men kræver mere end ét tal, skal gå til sprogmodellen.
+ROUTER_CASES = [
+    # (spørgsmål, forventet vej, tekst svaret skal indeholde)
+    ("How many women earned wages in 2020?", "llm", None),
+    ("What did eggs cost in 2021?", "llm", None),
+    ("Which sector had the lowest wage in 2020?", "llm", None),
+    ("Which sector had the highest wage in 2020?", "llm", None),
+    ("What is 2020 inflation minus 2019 inflation?", "llm", None),
+    ("What was the difference between inflation in 2019 and 2020?", "llm", None),
+    ("Was inflation higher in 2022 than in 2021?", "llm", None),
+    ("Which food had the most expensive price rise in 2022?", "llm", None),
+    ("What was the number of employees earning a salary in 2019?", "llm", None),
+    ("What was the price of butter in 2022?", "lookup", "only has the yearly % change"),
+    ("How much did butter prices change in 2022?", "lookup", "changed"),
+]
+
+
+def load_routes(path=QUESTIONS_PATH):
+    # Sektionerne i spørgsmålssættet: "# Opslag" forventes besvaret direkte, "# Åbne" af sprogmodellen
+    routes, expected = [], "lookup"
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("# Opslag"):
+                expected = "lookup"
+            elif line.startswith("# Åbne"):
+                expected = "llm"
+            elif line and not line.startswith("#"):
+                routes.append((line, expected, None))
+    return routes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check which questions the keyword router answers directly")
+    parser.add_argument("--questions", default=QUESTIONS_PATH)
+    parser.add_argument("--verbose", action="store_true", help="print every routed answer")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    import chatbot_logic
+
+    failures = []
+    cases = load_routes(args.questions) + ROUTER_CASES
+    for question, expected, needle in cases:
+        answer = chatbot_logic.answer_structured(question)
+        path = "llm" if answer is None else "lookup"
+        if args.verbose:
+            print(f"{path:<7} {question}" + (f"\n        {answer}" if answer else ""))
+        if path != expected:
+            failures.append(f"{question!r} went to {path}, expected {expected}")
+        elif needle and needle not in answer:
+            failures.append(f"{question!r} answer lacks {needle!r}: {answer!r}")
+
+    print(f"{len(cases) - len(failures)}/{len(cases)} questions routed as expected")
+    for line in failures:
+        print("FAIL", line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
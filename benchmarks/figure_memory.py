@@ -0,0 +1,125 @@
+import os
+import sys
+import gc
+import json
+import argparse
+import statistics
+import logging
+import warnings
+
+from view_latency import ROOT, discover_views, _new_app, _nav, _radios, _problems
+
+
+# ----------------------------------
+# Aktuel RSS for processen (MB)
+# ----------------------------------
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+# ----------------------------------
+# Største antal samtidigt åbne pyplot-figurer under et rerun.
+# Streamlit lukker alle figurer efter hvert script, så det er toppen
+# undervejs (og på tværs af sessioner) der tæller.
+# ----------------------------------
+_peak = {"figures": 0}
+
+
+def _track_open_figures():
+    from matplotlib._pylab_helpers import Gcf
+    if getattr(Gcf, "_peak_tracked", False):
+        return
+    original = Gcf._set_new_active_manager.__func__
+
+    def set_new_active_manager(cls, manager):
+        original(cls, manager)
+        _peak["figures"] = max(_peak["figures"], len(cls.figs))
+
+    Gcf._set_new_active_manager = classmethod(set_new_active_manager)
+    Gcf._peak_tracked = True
+
+
+def check_view(view, runs, warmup, timeout):
+    import matplotlib.pyplot as plt
+    _track_open_figures()
+
+    at = _new_app(timeout).run()
+    _nav(at).set_value(view["page"]).run()
+    if view["radio"] is not None:
+        _radios(at)[view["radio"]].set_value(view["option"]).run()
+
+    samples, open_figures = [], []
+    _peak["figures"] = 0
+    for _ in range(runs):
+        at.run()
+        gc.collect()
+        samples.append(rss_mb())
+        open_figures.append(len(plt.get_fignums()))
+
+    # Væksten måles efter opvarmning, hvor caches og imports er på plads.
+    # Medianen af hver halvdel tager højde for allocatorens udsving fra kørsel til kørsel.
+    measured = samples[min(warmup, runs - 1):]
+    half = max(1, len(measured) // 2)
+    growth = statistics.median(measured[-half:]) - statistics.median(measured[:half])
+    return {
+        "id": view["id"],
+        "rss_mb": [round(s, 1) for s in samples],
+        "growth_mb": round(growth, 1),
+        "open_figures": open_figures[-1],
+        "peak_open_figures": _peak["figures"],
+        "errors": [p[:300] for p in _problems(at)],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run every view N times and check that RSS stays flat")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=3, help="runs ignored before measuring growth")
+    parser.add_argument("--max-growth-mb", type=float, default=15.0)
+    parser.add_argument("--max-open-figures", type=int, default=1, help="allowed figures open at once")
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--output", help="optional JSON report")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    failures = []
+    results = []
+    for view in discover_views(args.timeout):
+        if args.filter not in view["id"]:
+            continue
+        result = check_view(view, args.runs, args.warmup, args.timeout)
+        results.append(result)
+
+        problems = []
+        if result["open_figures"]:
+            problems.append(f"{result['open_figures']} figures left open")
+        if result["peak_open_figures"] > args.max_open_figures:
+            problems.append(f"{result['peak_open_figures']} figures open at once")
+        if result["growth_mb"] > args.max_growth_mb:
+            problems.append(f"RSS grew {result['growth_mb']} MB")
+        if problems:
+            failures.append(f"{view['id']}: " + ", ".join(problems))
+        print(f"{view['id']:<70} growth {result['growth_mb']:6.1f} MB  peak open figures {result['peak_open_figures']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "warmup": args.warmup, "views": results}, f, indent=2, ensure_ascii=False)
+
+    for line in failures:
+        print("FAIL", line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import os
+import re
+import sys
+import subprocess
+from collections import defaultdict
+
+# Samme imports som main_app.py laver, før noget bliver vist
+APP_IMPORTS = """
+import streamlit
+import tabs.salary
+import tabs.SU.su_tab
+import tabs.food
+import tabs.chatbot
+import tabs.rent
+import tabs.comparison.su_vs_inflation_analysis
+import tabs.comparison.salary_vs_food
+import tabs.comparison.su_vs_salary
+import tabs.comparison.rent_vs_suPrStudent
+import tabs.comparison.rent_vs_food
+"""
+
+# Intro-siden behøver kun Streamlit – det er gulvet for koldstart
+INTRO_IMPORTS = "import streamlit"
+
+HEAVY = ["sklearn", "statsmodels", "scipy", "seaborn", "adjustText", "ollama"]
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ----------------------------------
+# Kør python -X importtime i en frisk proces og saml top-level moduler
+# ----------------------------------
+def measure(code=APP_IMPORTS):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    # Egen tid (self) summeres pr. pakke, så intet tælles dobbelt
+    totals = defaultdict(int)
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            totals[match.group(2).split(".")[0]] += int(match.group(1))
+    return totals
+
+
+def report(totals, top=15):
+    total_ms = sum(totals.values()) / 1000
+    lines = [f"Total import time: {total_ms:.0f} ms", ""]
+    lines.append("Heavy packages:")
+    for name in HEAVY:
+        lines.append(f"  {name:<12} {f'{totals[name] / 1000:.0f} ms' if name in totals else 'not loaded'}")
+    lines.append("")
+    lines.append(f"Top {top} top-level packages (self time, ms):")
+    for name, us in sorted(totals.items(), key=lambda x: -x[1])[:top]:
+        lines.append(f"  {name:<28} {us / 1000:8.1f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print("== main_app imports ==")
+    print(report(measure(APP_IMPORTS)))
+    print()
+    print("== Intro floor (streamlit only) ==")
+    print(report(measure(INTRO_IMPORTS), top=5))
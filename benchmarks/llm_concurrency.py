@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+import argparse
+import logging
+import warnings
+import threading
+
+from ollama_stub import start_stub
+from view_latency import ROOT
+
+# Få forskellige, åbne spørgsmål – flere sessioner stiller de samme
+QUESTIONS = [
+    "How have food prices changed?",
+    "Have wages kept up with inflation?",
+    "How does SU compare to rent for students?",
+]
+
+
+# ----------------------------------
+# N samtidige "sessioner" mod stubserveren: med den fælles kø skal modellen
+# højst køre LLM_MAX_CONCURRENT kald ad gangen og kun én gang pr. unikt spørgsmål
+# ----------------------------------
+def run_sessions(ask, sessions):
+    results = [None] * sessions
+    barrier = threading.Barrier(sessions)
+
+    def session(i):
+        question = QUESTIONS[i % len(QUESTIONS)]
+        positions = []
+        barrier.wait()
+        start = time.perf_counter()
+        answer = ask(question, positions.append)
+        results[i] = {"seconds": time.perf_counter() - start, "answer": answer,
+                      "max_position": max(positions, default=0)}
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the shared LLM queue with concurrent sessions against a local stub")
+    parser.add_argument("--sessions", type=int, default=9)
+    parser.add_argument("--token-seconds", type=float, default=0.02, help="simulated time per token")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    server, state, url = start_stub(load_seconds=0, token_seconds=args.token_seconds)
+    os.environ["OLLAMA_HOST"] = url
+
+    import chatbot_logic
+    from utils import answer_cache, llm_scheduler
+    chatbot_logic.get_context_snapshot()   # byg konteksten før målingerne
+
+    failures = []
+
+    # Før: hver session kalder modellen direkte
+    def ask_direct(question, on_queue):
+        response = chatbot_logic.get_client().chat(model=chatbot_logic.CHAT_MODEL,
+                                                   messages=chatbot_logic.build_messages(question))
+        return response["message"]["content"]
+
+    results, elapsed = run_sessions(ask_direct, args.sessions)
+    direct = state.stats()
+    print(f"direct:    {len(direct['requests'])} model calls, {direct['max_active']} at once, "
+          f"slowest session {max(r['seconds'] for r in results):.2f} s, total {elapsed:.2f} s")
+
+    # Efter: fælles kø, identiske spørgsmål deler én generation
+    state.reset()
+    answer_cache.clear_answers()
+    results, elapsed = run_sessions(lambda question, on_queue: chatbot_logic.ask_chatbot_about_data(question, on_queue=on_queue),
+                                    args.sessions)
+    queued = state.stats()
+    stats = llm_scheduler.scheduler_stats()
+    print(f"scheduled: {len(queued['requests'])} model calls, {queued['max_active']} at once, "
+          f"slowest session {max(r['seconds'] for r in results):.2f} s, total {elapsed:.2f} s")
+    print(f"           {stats['shared']} shared, deepest queue position seen {max(r['max_position'] for r in results)}, "
+          f"wait avg {stats['avg_wait_s']:.2f} s, p95 {stats['p95_wait_s']:.2f} s, max {stats['max_wait_s']:.2f} s")
+
+    unique = min(args.sessions, len(QUESTIONS))
+    if len(queued["requests"]) != unique:
+        failures.append(f"expected {unique} model calls (one per unique question), got {len(queued['requests'])}")
+    if queued["max_active"] > llm_scheduler.MAX_CONCURRENT:
+        failures.append(f"{queued['max_active']} model calls ran at once, limit is {llm_scheduler.MAX_CONCURRENT}")
+    if any(r["answer"] != results[0]["answer"] for r in results):
+        failures.append("sessions sharing a generation got different answers")
+
+    server.shutdown()
+    for line in failures:
+        print("FAIL", line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+import os
+import sys
+import time
+import argparse
+import logging
+import warnings
+
+from ollama_stub import start_stub
+from view_latency import ROOT
+
+# Åbne spørgsmål – opslagsspørgsmål besvares uden om modellen
+QUESTIONS = [
+    "How have food prices changed?",
+    "Have wages kept up with inflation?",
+    "Why did food prices rise so much in 2022?",
+    "How does SU compare to rent for students?",
+    "How did wages for women develop?",
+]
+
+FOLLOW_UPS = [
+    "How have food prices changed?",
+    "Which food category rose the most?",
+    "And how does that compare with wages?",
+    "What does that mean for students on SU?",
+]
+
+
+# ----------------------------------
+# Tjekker mod stubserveren at chatbotten genbruger én HTTP-forbindelse,
+# at modellen indlæses ved warm-up med keep_alive, og ikke igen pr. spørgsmål
+# ----------------------------------
+def ask_all(ask):
+    timings = []
+    for question in QUESTIONS:
+        start = time.perf_counter()
+        ask(question)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check Ollama client reuse and warm-up against a local stub")
+    parser.add_argument("--load-seconds", type=float, default=0.5, help="simulated model load time")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    # keep_alive 0 uden warm-up svarer til at modellen er smidt ud mellem spørgsmål
+    server, state, url = start_stub(load_seconds=args.load_seconds, token_seconds=0.001, default_keep_alive=0)
+    os.environ["OLLAMA_HOST"] = url
+
+    import chatbot_logic
+    from ollama import Client
+    from utils import answer_cache
+    from utils.answer_cache import answer_cache_stats
+    chatbot_logic.get_context_snapshot()   # byg konteksten før målingerne
+
+    failures = []
+
+    # Før: ny klient og ingen keep_alive for hvert spørgsmål
+    def ask_fresh(question):
+        Client().chat(model=chatbot_logic.CHAT_MODEL, messages=chatbot_logic.build_messages(question))
+
+    before = ask_all(ask_fresh)
+    fresh = state.stats()
+    print(f"fresh client:  {fresh['connections']} connections, {fresh['loads']} model loads, "
+          f"{sum(before) * 1000:.0f} ms for {len(QUESTIONS)} questions")
+
+    # Efter: warm-up ved start og én delt klient
+    state.reset()
+    chatbot_logic.warm_up_model()
+    warm = state.stats()
+    warm_up = warm["requests"][0] if warm["requests"] else {}
+    if warm["loads"] != 1 or warm_up.get("path") != "/api/generate" or warm_up.get("keep_alive") is None:
+        failures.append(f"warm-up did not preload the model with keep_alive: {warm}")
+
+    def ask_shared(question):
+        "".join(chatbot_logic.stream_chatbot_answer(question))
+
+    after = ask_all(ask_shared)
+    shared = state.stats()
+    print(f"shared client: {shared['connections']} connections, {shared['loads']} model loads "
+          f"(incl. warm-up), {sum(after) * 1000:.0f} ms for {len(QUESTIONS)} questions")
+
+    if shared["connections"] != 1:
+        failures.append(f"expected 1 reused connection, got {shared['connections']}")
+    if shared["loads"] != 1:
+        failures.append(f"model was loaded {shared['loads']} times, expected only at warm-up")
+    if any(r.get("keep_alive") is None for r in shared["requests"]):
+        failures.append("some requests were sent without keep_alive")
+
+    # Samme spørgsmål igen, med anden skrivemåde: svaret skal komme fra cachen
+    sent = len(shared["requests"])
+    hits_before = answer_cache_stats()["hits"]
+    repeated = ask_all(lambda question: chatbot_logic.ask_chatbot_about_data("  " + question.upper().rstrip("?") + " "))
+    cached = answer_cache_stats()
+    print(f"repeated:      {len(state.stats()['requests']) - sent} requests, {cached['hits'] - hits_before} cache hits, "
+          f"{sum(repeated) * 1000:.1f} ms for {len(QUESTIONS)} questions")
+    if len(state.stats()["requests"]) != sent:
+        failures.append("repeated questions reached the model instead of the answer cache")
+
+    # Samtale: opfølgende spørgsmål skal kun sende det nye efter den fælles begyndelse
+    def new_prompt_chars(conversation):
+        sent = len(state.stats()["requests"])
+        for question in FOLLOW_UPS:
+            chatbot_logic.ask_chatbot_about_data(question, conversation=conversation)
+        requests = state.stats()["requests"][sent:]
+        return sum(r["prompt_chars"] for r in requests), sum(r["new_prompt_chars"] for r in requests)
+
+    answer_cache.clear_answers()
+    total, fresh_chars = new_prompt_chars(None)
+    answer_cache.clear_answers()
+    conversation = chatbot_logic.new_conversation()
+    conversation_total, conversation_chars = new_prompt_chars(conversation)
+    print(f"follow-ups:    {fresh_chars:,} of {total:,} prompt chars processed as separate questions, "
+          f"{conversation_chars:,} of {conversation_total:,} in one conversation")
+    if conversation_chars >= fresh_chars:
+        failures.append("the conversation did not reduce the prompt the model has to process")
+
+    server.shutdown()
+    for line in failures:
+        print("FAIL", line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ----------------------------------
+# Lille stand-in for Ollamas HTTP-API (/api/chat, /api/generate).
+# Simulerer indlæsning af modellen, keep_alive og en CPU der deles mellem
+# samtidige kald, og tæller forbindelser, så man kan se om klienten genbruger dem.
+# ----------------------------------
+DEFAULT_REPLY = "This is a stub answer from the offline Ollama stand-in."
+
+
+def _parse_keep_alive(value, default):
+    # Samme former som Ollama: tal = sekunder, "5m"/"1h"/"30s", negativ = altid
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    for unit in sorted(units, key=len, reverse=True):
+        if value.endswith(unit):
+            return float(value[:-len(unit)]) * units[unit]
+    return float(value)
+
+
+class StubState:
+    def __init__(self, reply=DEFAULT_REPLY, load_seconds=0.5, token_seconds=0.01, default_keep_alive=300,
+                 latency_seconds=0.0, prompt_chars_per_second=0.0, reply_tokens=None):
+        if reply_tokens:
+            # Svar af fast længde, fx for at efterligne typiske llama3-svar
+            words = DEFAULT_REPLY.split(" ")
+            reply = " ".join(words[i % len(words)] for i in range(reply_tokens))
+        self.reply = reply
+        self.load_seconds = load_seconds
+        self.token_seconds = token_seconds
+        self.latency_seconds = latency_seconds
+        self.prompt_chars_per_second = prompt_chars_per_second
+        self.default_keep_alive = default_keep_alive
+        self.lock = threading.Lock()
+        self.loaded_until = {}   # model -> tidspunkt hvor den smides ud (inf = aldrig)
+        self.last_prompt = ""    # som Ollamas prompt-cache: kun det der afviger herfra behandles
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.connections = 0
+            self.loads = 0
+            self.requests = []
+            self.active = 0
+            self.max_active = 0
+
+    def stats(self):
+        with self.lock:
+            return {"connections": self.connections, "loads": self.loads, "requests": list(self.requests),
+                    "max_active": self.max_active}
+
+    def ensure_loaded(self, model, keep_alive):
+        # Returnerer ventetiden for indlæsning (0 hvis modellen allerede er indlæst)
+        now = time.monotonic()
+        with self.lock:
+            loaded = self.loaded_until.get(model, 0) > now
+            if not loaded:
+                self.loads += 1
+            seconds = _parse_keep_alive(keep_alive, self.default_keep_alive)
+            self.loaded_until[model] = float("inf") if seconds < 0 else now + seconds
+        if not loaded:
+            time.sleep(self.load_seconds)
+            return self.load_seconds
+        return 0.0
+
+    def prompt_cost(self, prompt):
+        # Antal tegn der skal behandles, når den fælles begyndelse med sidste prompt genbruges
+        with self.lock:
+            shared = 0
+            for a, b in zip(prompt, self.last_prompt):
+                if a != b:
+                    break
+                shared += 1
+            self.last_prompt = prompt
+        return len(prompt) - shared
+
+    def token_delay(self):
+        # En CPU-model deler regnekraften: samtidige generationer gør hver token langsommere
+        with self.lock:
+            return self.token_seconds * max(1, self.active)
+
+    def answer_for(self, messages):
+        reply = self.reply
+        return reply(messages) if callable(reply) else reply
+
+
+def _make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 så forbindelsen kan genbruges (keep-alive)
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with state.lock:
+                state.connections += 1
+
+        def log_message(self, *args):
+            pass
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def _send_json(self, payload, status=200):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_chunk(self, payload):
+            line = json.dumps(payload).encode("utf-8") + b"\n"
+            self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+            self.wfile.flush()
+
+        def do_GET(self):
+            if self.path in ("/", "/api/version"):
+                self._send_json({"version": "stub"})
+            else:
+                self._send_json({"error": "not found"}, status=404)
+
+        def do_POST(self):
+            if self.path not in ("/api/chat", "/api/generate"):
+                self._send_json({"error": "not found"}, status=404)
+                return
+
+            request = self._read_json()
+            if self.path == "/api/chat":
+                prompt = "".join(f"<{m.get('role')}>{m.get('content')}" for m in request.get("messages") or [])
+            else:
+                prompt = request.get("prompt") or ""
+            request["prompt_chars"] = len(prompt)
+            request["new_prompt_chars"] = state.prompt_cost(prompt)
+            with state.lock:
+                state.requests.append({"path": self.path, **request})
+                state.active += 1
+                state.max_active = max(state.max_active, state.active)
+            try:
+                self._generate(request)
+            finally:
+                with state.lock:
+                    state.active -= 1
+
+        def _generate(self, request):
+            model = request.get("model", "")
+            load_seconds = state.ensure_loaded(model, request.get("keep_alive"))
+            # Fast svartid plus behandling af den del af prompten der ikke lå i cachen
+            prompt_seconds = state.latency_seconds
+            if state.prompt_chars_per_second:
+                prompt_seconds += request["new_prompt_chars"] / state.prompt_chars_per_second
+            time.sleep(prompt_seconds)
+
+            if self.path == "/api/generate":
+                text = state.answer_for([{"role": "user", "content": request.get("prompt") or ""}]) if request.get("prompt") else ""
+            else:
+                text = state.answer_for(request.get("messages") or [])
+
+            # Som Ollama: ord for ord med mellemrum foran
+            words = text.split(" ") if text else []
+            tokens = [w if i == 0 else " " + w for i, w in enumerate(words)]
+
+            def part(content, done):
+                payload = {"model": model, "created_at": "1970-01-01T00:00:00Z", "done": done}
+                if self.path == "/api/chat":
+                    payload["message"] = {"role": "assistant", "content": content}
+                else:
+                    payload["response"] = content
+                if done:
+                    payload.update(done_reason="stop", load_duration=int(load_seconds * 1e9), eval_count=len(tokens),
+                                   prompt_eval_count=request["new_prompt_chars"] // 4,
+                                   prompt_eval_duration=int(prompt_seconds * 1e9))
+                return payload
+
+            if request.get("stream", True):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for token in tokens:
+                        time.sleep(state.token_delay())
+                        self._send_chunk(part(token, False))
+                    self._send_chunk(part("", True))
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True   # klienten afbrød streamen
+            else:
+                time.sleep(sum(state.token_delay() for _ in tokens))
+                self._send_json(part(text, True))
+
+    return Handler
+
+
+def start_stub(host="127.0.0.1", port=0, **options):
+    # Starter serveren i en baggrundstråd; returnerer (server, state, url)
+    state = StubState(**options)
+    server = ThreadingHTTPServer((host, port), _make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="ollama-stub", daemon=True).start()
+    return server, state, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline stand-in for the Ollama HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--load-seconds", type=float, default=0.5, help="simulated model load time")
+    parser.add_argument("--token-seconds", type=float, default=0.01, help="simulated time per token")
+    parser.add_argument("--latency-seconds", type=float, default=0.0, help="fixed delay before the first token")
+    parser.add_argument("--prompt-chars-per-second", type=float, default=0.0,
+                        help="simulated prompt processing rate for uncached prompt chars (0 = instant)")
+    parser.add_argument("--reply-tokens", type=int, help="length of the stub answer in tokens")
+    args = parser.parse_args(argv)
+
+    server, _, url = start_stub(args.host, args.port, load_seconds=args.load_seconds, token_seconds=args.token_seconds,
+                               latency_seconds=args.latency_seconds, prompt_chars_per_second=args.prompt_chars_per_second,
+                               reply_tokens=args.reply_tokens)
+    print(f"Ollama stub listening on {url} (set OLLAMA_HOST={url})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import os
+import sys
+import time
+import argparse
+import logging
+import warnings
+from fractions import Fraction
+
+import numpy as np
+
+from view_latency import ROOT
+
+# Sammenligner utils.poly_trend med den gamle sklearn-pipeline (PolynomialFeatures
+# + LinearRegression på rå år) på de rigtige data fra de tre forecast-visninger:
+#   python benchmarks/poly_trend.py --max-rel-error 1e-6
+
+
+# ----------------------------------
+# Eksakt reference: mindste kvadrater med brøker (normalligninger løst eksakt),
+# så hverken den gamle eller den nye metode er facit for sig selv
+# ----------------------------------
+def exact_fit(x, y, degree):
+    xs = [Fraction(float(v)) for v in x]
+    ys = [Fraction(float(v)) for v in y]
+    n = degree + 1
+    A = [[sum(xi ** (i + j) for xi in xs) for j in range(n)] for i in range(n)]
+    b = [sum(yi * xi ** i for xi, yi in zip(xs, ys)) for i in range(n)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if A[r][col] != 0), None)
+        if pivot is None:
+            return None
+        A[col], A[pivot] = A[pivot], A[col]
+        b[col], b[pivot] = b[pivot], b[col]
+        for r in range(n):
+            if r != col and A[r][col] != 0:
+                factor = A[r][col] / A[col][col]
+                A[r] = [a - factor * c for a, c in zip(A[r], A[col])]
+                b[r] -= factor * b[col]
+    return [b[i] / A[i][i] for i in range(n)]
+
+
+def exact_predict(coefs, x):
+    return np.array([float(sum(c * Fraction(float(v)) ** i for i, c in enumerate(coefs))) for v in x])
+
+
+def old_fit_predict(x, y, degree, future):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import PolynomialFeatures
+    X = np.asarray(x, dtype=float).reshape(-1, 1)
+    F = np.asarray(future, dtype=float).reshape(-1, 1)
+    if degree == 1:
+        return LinearRegression().fit(X, y).predict(F)
+    poly = PolynomialFeatures(degree=degree)
+    model = LinearRegression().fit(poly.fit_transform(X), y)
+    return model.predict(poly.transform(F))
+
+
+def new_fit_predict(x, y, degree, future):
+    from utils.poly_trend import fit_trend, predict_trend
+    return predict_trend(fit_trend(x, y, degree), future, degree)
+
+
+# ----------------------------------
+# Samme serier og grader som visningerne bruger
+# ----------------------------------
+def load_cases():
+    from tabs.SU.data_loading import get_su_dataset
+    from tabs.SU.regression_engine import SU_TARGETS, MAX_DEGREE
+    from tabs.rent_presentations.rent_data import loadRentData
+    from utils.salary_loader import load_salary_series
+
+    cases = []
+    su, _, _ = get_su_dataset()
+    years = su["Aar"].to_numpy(dtype=float)
+    for target in SU_TARGETS:
+        for degree in range(1, MAX_DEGREE + 1):
+            cases.append((f"SU {target} deg {degree}", years, su[target].to_numpy(dtype=float), degree,
+                          np.arange(years.min(), 2036)))
+
+    rent = loadRentData("Data/Rent/Huslejeindeks_2021-2024.xlsx")
+    for region in rent.index:
+        y = rent.loc[region].to_numpy(dtype=float)
+        x = np.arange(1, len(y) + 1, dtype=float)
+        cases.append((f"rent {region} deg 3", x, y, 3, np.arange(1, len(y) + 41, dtype=float)))
+
+    wages, _ = load_salary_series("All", "STANDARDBEREGNET TIMEFORTJENESTE", list(range(2013, 2024)), rounded=False)
+    years = wages.index.to_numpy(dtype=float)
+    for degree in (1, 3):
+        cases.append((f"salary wage deg {degree}", years, wages.round(1).to_numpy(dtype=float), degree,
+                      np.arange(2013, 2034, dtype=float)))
+    return cases
+
+
+def _time(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Accuracy and speed of the shared polynomial trend vs the old sklearn pipeline")
+    parser.add_argument("--repeat", type=int, default=200, help="timing repetitions per case")
+    parser.add_argument("--max-rel-error", type=float, help="fail if the new fit deviates more than this from the exact fit")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    cases = load_cases()
+    print(f"{'case':<44}{'old err':>10}{'new err':>10}{'old ms':>9}{'new ms':>9}")
+    worst_old, worst_new, total_old, total_new = 0.0, 0.0, 0.0, 0.0
+    for name, x, y, degree, future in cases:
+        coefs = exact_fit(x, y, degree)
+        if coefs is None:
+            continue
+        reference = exact_predict(coefs, future)
+        scale = np.abs(reference).max() or 1.0
+        old_err = np.abs(old_fit_predict(x, y, degree, future) - reference).max() / scale
+        new_err = np.abs(new_fit_predict(x, y, degree, future) - reference).max() / scale
+        old_ms = _time(lambda: old_fit_predict(x, y, degree, future), args.repeat)
+        new_ms = _time(lambda: new_fit_predict(x, y, degree, future), args.repeat)
+        worst_old, worst_new = max(worst_old, old_err), max(worst_new, new_err)
+        total_old += old_ms
+        total_new += new_ms
+        print(f"{name[:43]:<44}{old_err:>10.1e}{new_err:>10.1e}{old_ms:>9.3f}{new_ms:>9.3f}")
+
+    print(f"worst relative error vs exact fit: old {worst_old:.1e}, new {worst_new:.1e}")
+    print(f"fit + predict over {len(cases)} cases: old {total_old:.2f} ms, new {total_new:.2f} ms "
+          f"({total_old / total_new:.1f}x)")
+
+    # Reproducerbarhed: samme input giver bit-identiske koefficienter
+    from utils.poly_trend import fit_trend
+    name, x, y, degree, _ = cases[0]
+    first, second = fit_trend(x, y, degree), fit_trend(x, y, degree)
+    reproducible = all(np.array_equal(first["coefs"][d], second["coefs"][d]) for d in first["coefs"])
+
+    failures = []
+    if args.max_rel_error is not None and worst_new > args.max_rel_error:
+        failures.append(f"new fit relative error {worst_new:.1e} > {args.max_rel_error}")
+    if total_new > total_old:
+        failures.append(f"new fit is slower than the sklearn pipeline ({total_new:.2f} ms > {total_old:.2f} ms)")
+    if not reproducible:
+        failures.append("repeated fits gave different coefficients")
+    for line in failures:
+        print("FAIL", line)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
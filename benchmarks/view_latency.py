@@ -0,0 +1,175 @@
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import statistics
+import subprocess
+import tempfile
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "main_app.py")
+NAV_LABEL = "Navigation"
+
+
+# ----------------------------------
+# Kør appen headless med Streamlits AppTest
+# ----------------------------------
+def _new_app(timeout):
+    from streamlit.testing.v1 import AppTest
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+
+def _radios(at):
+    # Alle radioer på siden undtagen selve navigationen, i visningsrækkefølge
+    return [r for r in at.radio if r.label != NAV_LABEL]
+
+
+def _nav(at):
+    return next(r for r in at.radio if r.label == NAV_LABEL)
+
+
+def _problems(at):
+    return [e.value for e in at.exception] + [e.value for e in at.error]
+
+
+def discover_views(timeout=600):
+    # Et view er en side, eller en side + ét valg i én af sidens radioer
+    at = _new_app(timeout).run()
+    views = []
+    for page in _nav(at).options:
+        _nav(at).set_value(page).run()
+        radios = _radios(at)
+        if not radios:
+            views.append({"id": page, "page": page, "radio": None, "option": None})
+            continue
+        for radio_pos, radio in enumerate(radios):
+            for option in radio.options:
+                label = radio.label or f"radio {radio_pos}"
+                views.append({
+                    "id": f"{page} / {label} / {option}",
+                    "page": page,
+                    "radio": radio_pos,
+                    "option": option,
+                })
+    return views
+
+
+def time_view(view, repeats=3, timeout=600):
+    at = _new_app(timeout).run()
+
+    # Kold: første kørsel hvor viewet vises i denne proces
+    start = time.perf_counter()
+    _nav(at).set_value(view["page"]).run()
+    if view["radio"] is not None:
+        _radios(at)[view["radio"]].set_value(view["option"]).run()
+    cold = time.perf_counter() - start
+
+    # Varm: samme view genkørt med uændret state (som ved et widget-klik)
+    warm = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+
+    return {
+        "id": view["id"],
+        "cold_s": round(cold, 4),
+        "warm_s": [round(w, 4) for w in warm],
+        "warm_median_s": round(statistics.median(warm), 4) if warm else None,
+        "errors": [p[:300] for p in _problems(at)],
+    }
+
+
+def _time_isolated(view, repeats, timeout):
+    # Hver view i sin egen proces, så "kold" også betyder tomme caches i hukommelsen
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        out_path = tmp.name
+    try:
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--only", view["id"],
+             "--repeats", str(repeats), "--timeout", str(timeout), "--output", out_path],
+            cwd=ROOT, check=True, capture_output=True,
+        )
+        with open(out_path, encoding="utf-8") as f:
+            return json.load(f)["views"][0]
+    finally:
+        os.remove(out_path)
+
+
+# ----------------------------------
+# Sammenlign med en tidligere rapport
+# ----------------------------------
+def find_regressions(report, baseline, tolerance):
+    old = {v["id"]: v for v in baseline["views"]}
+    regressions = []
+    for view in report["views"]:
+        before = old.get(view["id"])
+        if before is None:
+            continue
+        for metric in ("cold_s", "warm_median_s"):
+            if before[metric] and view[metric] > before[metric] * (1 + tolerance):
+                regressions.append(f"{view['id']}: {metric} {before[metric]:.3f}s -> {view[metric]:.3f}s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless latency per view in main_app")
+    parser.add_argument("--repeats", type=int, default=3, help="warm reruns per view")
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "view_latency.json"))
+    parser.add_argument("--filter", default="", help="only views whose id contains this text")
+    parser.add_argument("--only", help="time exactly one view id")
+    parser.add_argument("--isolate", action="store_true", help="time each view in a fresh process")
+    parser.add_argument("--fresh-disk-cache", action="store_true", help="ignore the parquet caches in .cache/")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.CRITICAL)
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    if args.fresh_disk_cache:
+        os.environ["DATA_CACHE_DIR"] = os.path.join(tempfile.mkdtemp(), "excel")
+
+    views = discover_views(args.timeout)
+    if args.only:
+        views = [v for v in views if v["id"] == args.only]
+    elif args.filter:
+        views = [v for v in views if args.filter in v["id"]]
+
+    results = []
+    for view in views:
+        if args.isolate and not args.only:
+            result = _time_isolated(view, args.repeats, args.timeout)
+        else:
+            result = time_view(view, args.repeats, args.timeout)
+        results.append(result)
+        if not args.only:
+            flag = "  !" if result["errors"] else ""
+            print(f"{result['id']:<70} cold {result['cold_s']:7.3f}s  warm {result['warm_median_s']:7.3f}s{flag}")
+
+    report = {
+        "python": sys.version.split()[0],
+        "repeats": args.repeats,
+        "isolated": bool(args.isolate),
+        "fresh_disk_cache": bool(args.fresh_disk_cache),
+        "views": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = find_regressions(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
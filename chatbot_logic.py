@@ -1,104 +1,786 @@
 import os
+import re
+import json
+import hashlib
+import threading
 import pandas as pd
-from ollama import Client
+from utils.excel_cache import CACHE_DIR, read_excel
+from utils.salary_cube import available_years, workbook_slice, workbook_label_index, find_category
+from utils.bm25 import build_bm25_index, search, tokenize
+from utils import answer_cache, llm_scheduler
+from utils.perf import span, register_panel_stats
+
+DATA_DIR = "Data"
+DATA_EXTENSIONS = (".xlsx", ".csv")
+CONTEXT_PATH = os.path.join(os.path.dirname(CACHE_DIR) or ".", "chatbot_context.json")
+SNAPSHOT_FORMAT = 3
+
+# Antal fakta og samlet længde der sendes med hvert spørgsmål
+TOP_K_FACTS = 12
+MAX_CONTEXT_CHARS = 4000
+
+SECTION_TITLES = {
+    "salary": "📂 Salary Insights",
+    "food": "🥦 Food Insights",
+    "su": "🎓 SU Insights",
+    "inflation": "💹 Inflation Insights",
+}
+
+# Ord der indekseres sammen med hvert faktum, så "løn" også finder lønfakta
+SECTION_KEYWORDS = {
+    "salary": "salary salaries wage wages hourly earnings pay løn timeløn timefortjeneste",
+    "food": "food foods price prices grocery groceries mad fødevarer madpriser",
+    "su": "su student students grant grants support stipend studerende støtte",
+    "inflation": "inflation cpi consumer prices forbrugerpriser prisudvikling",
+}
+
+# Datasættene er på dansk – almindelige engelske ord i spørgsmål oversættes til søgningen
+QUERY_SYNONYMS = {
+    "butter": "smør", "milk": "mælk", "bread": "brød", "rice": "ris", "cheese": "ost",
+    "eggs": "æg", "egg": "æg", "meat": "kød", "beef": "oksekød", "pork": "svinekød",
+    "chicken": "fjerkræ", "fish": "fisk", "fruit": "frugt", "vegetables": "grøntsager",
+    "potatoes": "kartofler", "sugar": "sukker", "coffee": "kaffe", "tea": "te",
+    "oil": "olie", "chocolate": "chokolade", "flour": "mel", "public": "stat regioner kommuner",
+    "private": "virksomheder", "state": "stat", "municipalities": "kommuner", "regions": "regioner",
+    "loans": "lån", "loan": "lån", "recipients": "støttemodtagere", "home": "hjemmeboende",
+}
+
+STOP_WORDS = set("""
+a an the of in on at to for and or is was were be been are how what which who when why
+did does do has have had by with from about between than this that these those much many
+i me my we you it its there their
+""".split())
+
+SALARY_GROUPS = {"All": "all employees", "Men": "men", "Women": "women"}
+
+
+def _fmt(value):
+    if pd.isna(value):
+        return "n/a"
+    value = float(value)
+    return f"{value:,.0f}" if abs(value) >= 1000 else f"{value:g}"
+
+
+def _number(value):
+    # JSON-venlig værdi: tal eller None for manglende
+    value = pd.to_numeric(value, errors="coerce")
+    return None if pd.isna(value) else float(value)
+
+
+def _grouped(records, *fields):
+    # Grupperer poster i den rækkefølge de optræder; fejlposter står alene
+    groups = {}
+    for i, record in enumerate(records):
+        key = ("error", i) if "error" in record else tuple(record[field] for field in fields)
+        groups.setdefault(key, []).append(record)
+    return groups.values()
+
 
 # ----------------------------------
-# Ekstraher indsigt fra løndata
+# Løndata: én post pr. gruppe, år og sektor
 # ----------------------------------
-def extract_salary_insights():
-    summaries = []
-    folder_path = "Data/Salary/Stats all 13 - 23 salary"
+def salary_records():
+    records = []
+    for group in SALARY_GROUPS:
+        for year in available_years(group):
+            part = workbook_slice(group, year)
+            match_rows = find_category(part, "standardberegnet timefortjeneste", exact=True,
+                                       label_index=workbook_label_index(group, year))
+            if match_rows is None:
+                continue
+            for sector, value in zip(match_rows["sector"], match_rows["value"]):
+                records.append({"group": group, "year": int(year), "sector": sector, "value": _number(value)})
+    return records
 
-    for file in sorted(os.listdir(folder_path)):
-        if file.endswith(".xlsx"):
-            file_path = os.path.join(folder_path, file)
-            try:
-                df = pd.read_excel(file_path, sheet_name="LONS30", header=None)
-                df = df.dropna(how="all").dropna(axis=1, how="all")
-                df[2] = df[2].astype(str).str.strip()
-
-                match_row = df[df[2].str.lower() == "standardberegnet timefortjeneste"]
-                if not match_row.empty:
-                    row_idx = match_row.index[0]
-                    sectors = df.loc[2, 3:8].tolist()
-                    values = df.loc[row_idx, 3:8].tolist()
-                    year = file.split()[1].split('.')[0]
-
-                    summary = f"In {year}, the average hourly wages by sector were: " + \
-                              ", ".join([f"{s}: {v} DKK" for s, v in zip(sectors, values)])
-                    summaries.append(summary)
-            except Exception as e:
-                summaries.append(f"Error reading {file}: {e}")
-    return "\n".join(summaries)
+
+def salary_facts(records=None):
+    records = salary_records() if records is None else records
+    facts = []
+    for rows in _grouped(records, "group", "year"):
+        group, year = rows[0]["group"], rows[0]["year"]
+        who = "" if group == "All" else f" for {SALARY_GROUPS[group]}"
+        facts.append(f"In {year}, the average hourly wages by sector{who} were: " +
+                     ", ".join([f"{r['sector']}: {r['value']} DKK" for r in rows]))
+    return facts
+
+
+def extract_salary_insights():
+    return "\n".join(salary_facts())
 
 
 # ----------------------------------
-# Ekstraher indsigt fra maddata
+# Maddata: prisændring og forbrug pr. varegruppe og år
 # ----------------------------------
+def food_records():
+    from tabs.food_presentation.food_clean_data import load_and_clean
+    from tabs.food_presentation.food_clean_data_expenditure import load_and_clean_expenditure
+
+    records = []
+    try:
+        _, price_df, price_years = load_and_clean()
+        for _, row in price_df.iterrows():
+            for year in price_years:
+                records.append({"kind": "price", "category": row["Category"], "year": int(year), "value": _number(row[year])})
+    except Exception as e:
+        records.append({"error": f"❌ Error reading food prices: {e}"})
+
+    try:
+        cons_long, _ = load_and_clean_expenditure()
+        for category, year, value in zip(cons_long["Category"], cons_long["Year"], cons_long["Expenditure"]):
+            records.append({"kind": "expenditure", "category": category, "year": int(year), "value": _number(value)})
+    except Exception as e:
+        records.append({"error": f"❌ Error reading food expenditure: {e}"})
+    return records
+
+
+def food_facts(records=None):
+    records = food_records() if records is None else records
+    facts = []
+    for rows in _grouped(records, "kind", "category"):
+        first = rows[0]
+        if "error" in first:
+            facts.append(first["error"])
+        elif first["kind"] == "price":
+            facts.append(f"Food price change for {first['category']} (% vs previous year): " +
+                         ", ".join(f"{r['year']}: {_fmt(r['value'])}%" for r in rows))
+        else:
+            facts.append(f"Average household expenditure on {first['category']} (DKK per household): " +
+                         ", ".join(f"{r['year']}: {_fmt(r['value'])}" for r in rows))
+    return facts
+
+
 def extract_food_insights():
-    folder = "Data/Food"
-    summaries = []
-    for filename in os.listdir(folder):
-        if filename.endswith(".xlsx"):
-            filepath = os.path.join(folder, filename)
-            try:
-                df = pd.read_excel(filepath)
-                summaries.append(f"📊 {filename}:\n{df.head(3).to_string(index=False)}")
-            except Exception as e:
-                summaries.append(f"❌ Error reading {filename}: {e}")
-    return "\n".join(summaries)
+    return "\n".join(food_facts())
 
 
 # ----------------------------------
-# Ekstraher indsigt fra SU-data
+# SU-data: én post pr. fil, år og kolonne
 # ----------------------------------
-def extract_su_insights():
+def su_records():
     folder = "Data/SU"
-    summaries = []
-    for filename in os.listdir(folder):
+    records = []
+    for filename in sorted(os.listdir(folder)):
         if filename.endswith(".xlsx"):
             filepath = os.path.join(folder, filename)
+            name = os.path.splitext(filename)[0]
             try:
-                df = pd.read_excel(filepath)
-                summaries.append(f"📚 {filename}:\n{df.head(3).to_string(index=False)}")
+                df = read_excel(filepath)
+                year_col = df.columns[0]
+                for _, row in df.iterrows():
+                    year = pd.to_numeric(row[year_col], errors="coerce")
+                    if pd.isna(year):
+                        continue
+                    for col in df.columns[1:]:
+                        records.append({"dataset": name, "year": int(year),
+                                        "measure": str(col).strip(' -*'), "value": _number(row[col])})
             except Exception as e:
-                summaries.append(f"❌ Error reading {filename}: {e}")
-    return "\n".join(summaries)
+                records.append({"error": f"❌ Error reading {filename}: {e}"})
+    return records
+
+
+def su_facts(records=None):
+    records = su_records() if records is None else records
+    facts = []
+    for rows in _grouped(records, "dataset", "year"):
+        first = rows[0]
+        if "error" in first:
+            facts.append(first["error"])
+            continue
+        values = "; ".join(f"{r['measure']}: {_fmt(r['value'])}" for r in rows)
+        facts.append(f"SU {first['dataset']}, {first['year']}: {values}")
+    return facts
+
+
+def extract_su_insights():
+    return "\n".join(su_facts())
 
 
 # ----------------------------------
-# Ekstraher indsigt fra Inflation
+# Inflation: én post pr. måned
 # ----------------------------------
-def extract_inflation_insights():
+def inflation_records():
     try:
-        df = pd.read_excel("Data/Inflation.xlsx")
-        return f"📈 Inflation overview:\n{df.head(5).to_string(index=False)}"
+        df = read_excel("Data/Inflation.xlsx", header=None)
+        periods = df.iloc[2, 1:]
+        values = pd.to_numeric(df.iloc[3, 1:], errors="coerce")
+        monthly = pd.DataFrame({"period": periods.astype(str), "value": values}).dropna()
+        return [
+            {"year": int(period[:4]), "month": int(period[-2:]), "value": float(value)}
+            for period, value in zip(monthly["period"], monthly["value"])
+        ]
     except Exception as e:
-        return f"❌ Error reading Inflation.xlsx: {e}"
+        return [{"error": f"❌ Error reading Inflation.xlsx: {e}"}]
+
+
+def inflation_facts(records=None):
+    records = inflation_records() if records is None else records
+    facts = []
+    for rows in _grouped(records, "year"):
+        first = rows[0]
+        if "error" in first:
+            facts.append(first["error"])
+            continue
+        average = pd.Series([r["value"] for r in rows]).mean()
+        facts.append(
+            f"Inflation in {first['year']} (consumer prices, % change vs same month the year before): "
+            f"average {average:.1f}%; by month " +
+            ", ".join(f"{r['month']:02d}: {_fmt(r['value'])}%" for r in rows)
+        )
+    return facts
+
+
+def extract_inflation_insights():
+    return "\n".join(inflation_facts())
 
 
 # ----------------------------------
-# Chatbot-svar baseret på samlet indsigt
+# Fakta bygges én gang pr. dataversion og gemmes på disk
 # ----------------------------------
-def ask_chatbot_about_data(question):
-    client = Client()
+def data_version():
+    # Hash af sti, mtime og størrelse for datafilerne under Data/ – ikke bytecode
+    # eller Excels låsefiler (~$...), som opstår bare ved at åbne en projektmappe
+    sha = hashlib.sha1()
+    for root, dirs, files in os.walk(DATA_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.startswith("~$") or not name.endswith(DATA_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            sha.update(f"{os.path.relpath(path, DATA_DIR)}|{stat.st_mtime_ns}|{stat.st_size}\n".encode("utf-8"))
+    return sha.hexdigest()
 
-    combined_context = "\n".join([
-        "📂 Salary Insights:\n" + extract_salary_insights(),
-        "🥦 Food Insights:\n" + extract_food_insights(),
-        "🎓 SU Insights:\n" + extract_su_insights(),
-        "💹 Inflation Insights:\n" + extract_inflation_insights(),
-    ])
 
-    response = client.chat(
-        model="llama3",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant answering questions based on data from Denmark (wages, food prices, SU, and inflation)."},
-            {"role": "user", "content": combined_context[:8000]},
-            {"role": "user", "content": question}
-        ]
+def build_context_tables():
+    return {
+        "salary": salary_records(),
+        "food": food_records(),
+        "su": su_records(),
+        "inflation": inflation_records(),
+    }
+
+
+def build_context_sections(tables=None):
+    tables = build_context_tables() if tables is None else tables
+    return {
+        "salary": salary_facts(tables["salary"]),
+        "food": food_facts(tables["food"]),
+        "su": su_facts(tables["su"]),
+        "inflation": inflation_facts(tables["inflation"]),
+    }
+
+
+_context_snapshot = None
+_fact_index = None
+
+
+def get_context_snapshot():
+    global _context_snapshot
+
+    version = data_version()
+    if _context_snapshot is not None and _context_snapshot["version"] == version:
+        return _context_snapshot
+
+    snapshot = None
+    try:
+        with open(CONTEXT_PATH, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") != version or snapshot.get("format") != SNAPSHOT_FORMAT:
+            snapshot = None
+    except (OSError, ValueError):
+        snapshot = None
+
+    if snapshot is None:
+        tables = build_context_tables()
+        snapshot = {"format": SNAPSHOT_FORMAT, "version": version,
+                    "sections": build_context_sections(tables), "tables": tables}
+        try:
+            os.makedirs(os.path.dirname(CONTEXT_PATH) or ".", exist_ok=True)
+            tmp_path = CONTEXT_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, CONTEXT_PATH)
+        except OSError:
+            pass  # konteksten virker stadig i hukommelsen
+
+    _context_snapshot = snapshot
+    return snapshot
+
+
+def _format_context(facts_by_section):
+    return "\n".join(
+        f"{SECTION_TITLES[section]}:\n" + "\n".join(facts)
+        for section, facts in facts_by_section.items() if facts
     )
-    return response['message']['content']
+
+
+def get_combined_context():
+    return _format_context(get_context_snapshot()["sections"])
+
+
+# ----------------------------------
+# BM25-søgning over fakta – kun de relevante sendes med spørgsmålet
+# ----------------------------------
+def get_fact_index():
+    global _fact_index
+
+    snapshot = get_context_snapshot()
+    if _fact_index is not None and _fact_index["version"] == snapshot["version"]:
+        return _fact_index
+
+    facts = [(section, fact) for section, section_facts in snapshot["sections"].items() for fact in section_facts]
+    index = build_bm25_index([f"{SECTION_KEYWORDS[section]} {fact}" for section, fact in facts])
+    _fact_index = {"version": snapshot["version"], "facts": facts, "index": index}
+    return _fact_index
+
+
+def _search_terms(question):
+    terms = []
+    for token in tokenize(question):
+        if token in STOP_WORDS:
+            continue
+        terms.append(token)
+        if token in QUERY_SYNONYMS:
+            terms.append(QUERY_SYNONYMS[token])
+    return " ".join(terms)
+
+
+def retrieve_facts(question, k=TOP_K_FACTS, max_chars=MAX_CONTEXT_CHARS):
+    fact_index = get_fact_index()
+    facts = fact_index["facts"]
+
+    ranked = [doc_id for doc_id, _ in search(fact_index["index"], _search_terms(question), k=k)]
+    if not ranked:
+        # Ingen ord matcher – send det nyeste faktum fra hver sektion som overblik
+        latest = {}
+        for doc_id, (section, _) in enumerate(facts):
+            latest[section] = doc_id
+        ranked = list(latest.values())
+
+    selected = {section: [] for section in SECTION_TITLES}
+    used = 0
+    for doc_id in ranked:
+        section, fact = facts[doc_id]
+        if used and used + len(fact) > max_chars:
+            break
+        selected[section].append(fact)
+        used += len(fact)
+    return selected
+
+
+def build_question_context(question):
+    return _format_context(retrieve_facts(question))
+
+
+# ----------------------------------
+# Opslagsspørgsmål ("Hvad var lønnen i staten i 2020?") besvares direkte fra data.
+# Alt andet – eller hvis spørgsmålet er tvetydigt – går videre til sprogmodellen.
+# ----------------------------------
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+OPEN_ENDED_WORDS = {"why", "explain", "compare", "comparison", "trend", "trends", "predict", "forecast",
+                    "future", "should", "will", "would", "could", "affect", "impact", "relationship", "hvorfor",
+                    "after", "before", "since", "until", "happened"}
+SALARY_WORDS = {"salary", "salaries", "wage", "wages", "earn", "earnings", "hourly", "løn", "lønnen", "timeløn"}
+INFLATION_WORDS = {"inflation", "cpi"}
+SU_WORDS = {"su", "grant", "grants", "stipend", "stipendium", "recipients", "borrowers", "støttemodtagere"}
+# Ranglister, sammenligninger og regnestykker kræver mere end et opslag
+COMPARISON_WORDS = {"highest", "lowest", "most", "least", "minus", "plus", "difference", "than", "more", "less",
+                    "higher", "lower", "best", "worst", "rank", "ranking", "versus", "vs"}
+# Antal personer findes ikke i løndata – kun for SU
+COUNT_WORDS = {"many", "number", "count", "antal"}
+# Data har kun den årlige ændring i priser, ikke selve prisen ("What did eggs cost?")
+FOOD_PRICE_WORDS = {"price", "prices", "priser"}
+PRICE_CHANGE_WORDS = {"change", "changed", "changes", "rise", "rose", "risen", "increase", "increased",
+                      "fall", "fell", "drop", "dropped", "percent", "percentage", "ændring", "steg", "faldt"}
+FOOD_SPENDING_WORDS = {"spend", "spent", "spending", "expenditure", "expenditures", "consumption", "forbrug"}
+SU_COUNT_WORDS = {"many", "number", "recipients", "borrowers", "count", "antal"}
+SU_AMOUNT_WORDS = {"much", "amount", "total", "spent", "paid", "million", "mio", "kr", "dkk"}
+SU_LOAN_WORDS = {"loan", "loans", "borrowers", "lån", "låntagere"}
+
+SALARY_GROUP_WORDS = {
+    "Women": {"women", "woman", "female", "females", "kvinder"},
+    "Men": {"men", "man", "male", "males", "mænd"},
+}
+SECTOR_WORDS = {
+    "public": ["Stat", "Regioner", "Kommuner"],
+    "state": ["Stat"],
+    "government": ["Stat"],
+    "stat": ["Stat"],
+    "regions": ["Regioner"],
+    "regional": ["Regioner"],
+    "region": ["Regioner"],
+    "regioner": ["Regioner"],
+    "municipal": ["Kommuner"],
+    "municipalities": ["Kommuner"],
+    "municipality": ["Kommuner"],
+    "kommuner": ["Kommuner"],
+    "private": ["Virksomheder"],
+    "companies": ["Virksomheder"],
+    "businesses": ["Virksomheder"],
+    "virksomheder": ["Virksomheder"],
+    "total": ["Sektorer i alt"],
+}
+MONTHS = {name: number for number, names in enumerate([
+    ("january", "jan", "januar"), ("february", "feb", "februar"), ("march", "mar", "marts"),
+    ("april", "apr"), ("may", "maj"), ("june", "jun", "juni"), ("july", "jul", "juli"),
+    ("august", "aug"), ("september", "sep", "sept"), ("october", "oct", "okt", "oktober"),
+    ("november", "nov"), ("december", "dec"),
+], start=1) for name in names}
+
+
+def _food_category(tokens, records):
+    # Varegruppen hvis navn matcher flest ord i spørgsmålet; ved lighed den korteste
+    terms = set(tokens)
+    for token in tokens:
+        terms.update(QUERY_SYNONYMS.get(token, "").split())
+    best, best_key = None, None
+    for category in dict.fromkeys(r["category"] for r in records if "category" in r):
+        words = [w for w in tokenize(category) if not w.isdigit()]
+        hits = len(terms.intersection(words))
+        if not hits:
+            continue
+        key = (-hits, len(words), category.count("."))
+        if best_key is None or key < best_key:
+            best, best_key = category, key
+    return best
+
+
+def _lookup(records, years, label, **match):
+    # Samler værdier for de ønskede år; manglende år nævnes i svaret
+    rows = [r for r in records if "error" not in r and all(r.get(k) == v for k, v in match.items())]
+    available = sorted({r["year"] for r in rows})
+    if not available:
+        return None, None
+    missing = [year for year in years if year not in available]
+    if missing:
+        return None, (f"There is no {label} data for {', '.join(map(str, missing))}; "
+                      f"available years are {available[0]}–{available[-1]}.")
+    return [r for r in rows if r["year"] in years], None
+
+
+def _salary_answer(tokens, years, tables):
+    group = next((g for g, words in SALARY_GROUP_WORDS.items() if words.intersection(tokens)), "All")
+    prefixes = [p for token in tokens for p in SECTOR_WORDS.get(token, [])]
+
+    lines = []
+    for year in years:
+        rows, problem = _lookup(tables["salary"], [year], "salary", group=group)
+        if problem:
+            return problem
+        if rows is None:
+            return None
+        if prefixes:
+            rows = [r for r in rows if any(r["sector"].startswith(p) for p in prefixes)]
+        lines.append(f"In {year}, the average hourly wage for {SALARY_GROUPS[group]} was " +
+                     "; ".join(f"{r['sector']}: {_fmt(r['value'])} DKK" for r in rows) + ".")
+    return "\n".join(lines)
+
+
+def _inflation_answer(tokens, years, tables):
+    months = [MONTHS[t] for t in tokens if t in MONTHS]
+    rows, problem = _lookup(tables["inflation"], years, "inflation")
+    if problem or rows is None:
+        return problem
+
+    lines = []
+    for year in years:
+        year_rows = [r for r in rows if r["year"] == year]
+        if months:
+            lines += [f"Inflation in {year}-{r['month']:02d} was {_fmt(r['value'])}% (consumer prices vs the same month the year before)."
+                      for r in year_rows if r["month"] in months]
+        else:
+            average = pd.Series([r["value"] for r in year_rows]).mean()
+            lines.append(f"Inflation in {year} averaged {average:.1f}% (consumer prices, {len(year_rows)} months).")
+    return "\n".join(lines) or None
+
+
+def _food_answer(tokens, years, tables, kind):
+    records = [r for r in tables["food"] if r.get("kind") == kind]
+    category = _food_category(tokens, records)
+    if category is None:
+        return None
+    rows, problem = _lookup(records, years, f"food {kind}", category=category)
+    if problem or rows is None:
+        return problem
+    if kind == "price":
+        lines = [f"Prices for {category} changed {_fmt(r['value'])}% in {r['year']} compared with the year before."
+                 for r in rows]
+        if not PRICE_CHANGE_WORDS.intersection(tokens):
+            lines.insert(0, f"The data only has the yearly % change in food prices, not the price of {category} itself.")
+        return "\n".join(lines)
+    return "\n".join(f"Average household expenditure on {category} in {r['year']} was {_fmt(r['value'])} DKK."
+                     for r in rows)
+
+
+def _su_answer(tokens, years, tables):
+    loans = bool(SU_LOAN_WORDS.intersection(tokens))
+    if SU_COUNT_WORDS.intersection(tokens):
+        who = ""
+        if "home" in tokens:
+            away = {"not", "away", "outside"}.intersection(tokens)
+            dataset = "students_not_living_at_home" if away else "students_living_at_home"
+            who = " among students not living at home" if away else " among students living at home"
+        else:
+            dataset = "Antal støttemodtagere og låntagere"
+        measure = "Antal låntagere" if loans else "Antal støttemodtagere"
+        label, unit = f"The number of SU {'borrowers' if loans else 'recipients'}{who}", ""
+    elif SU_AMOUNT_WORDS.intersection(tokens) and "home" not in tokens:
+        # Beløb findes kun for alle studerende samlet, ikke pr. boform
+        dataset = "SU stipendier og lån (mio. kr.)"
+        measure = "Lån (mio. kr)" if loans else "Stipendie (mio. kr)"
+        label, unit = f"Total SU {'loans' if loans else 'grants'} paid out", " million DKK"
+    else:
+        return None
+
+    rows, problem = _lookup(tables["su"], years, "SU", dataset=dataset, measure=measure)
+    if problem or rows is None:
+        return problem
+    return "\n".join(f"{label} in {r['year']} was {_fmt(r['value'])}{unit}." for r in rows)
+
+
+def answer_structured(question):
+    tokens = tokenize(question)
+    years = sorted({int(y) for y in _YEAR.findall(question)})
+    if not years or OPEN_ENDED_WORDS.intersection(tokens) or COMPARISON_WORDS.intersection(tokens):
+        return None
+
+    tables = get_context_snapshot()["tables"]
+    intents = []
+    if SALARY_WORDS.intersection(tokens):
+        if COUNT_WORDS.intersection(tokens):
+            return None
+        intents.append(lambda: _salary_answer(tokens, years, tables))
+    if INFLATION_WORDS.intersection(tokens):
+        intents.append(lambda: _inflation_answer(tokens, years, tables))
+    if SU_WORDS.intersection(tokens):
+        intents.append(lambda: _su_answer(tokens, years, tables))
+    if FOOD_PRICE_WORDS.intersection(tokens):
+        intents.append(lambda: _food_answer(tokens, years, tables, "price"))
+    if FOOD_SPENDING_WORDS.intersection(tokens):
+        intents.append(lambda: _food_answer(tokens, years, tables, "expenditure"))
+
+    # Kun ét entydigt emne besvares direkte
+    if len(intents) != 1:
+        return None
+    return intents[0]()
+
+
+# ----------------------------------
+# Chatbot-svar baseret på de mest relevante fakta
+# ----------------------------------
+CHAT_MODEL = "llama3"
+SYSTEM_PROMPT = "You are a helpful assistant answering questions based on data from Denmark (wages, food prices, SU, and inflation)."
+
+# Hvor længe Ollama holder modellen i hukommelsen efter sidste kald (fx "30m", "-1" = altid)
+KEEP_ALIVE = os.environ.get("CHATBOT_KEEP_ALIVE", "30m")
+
+
+def _keep_alive():
+    # Ollama forventer et tal for sekunder/uendelig og en streng for varigheder
+    try:
+        return float(KEEP_ALIVE)
+    except ValueError:
+        return KEEP_ALIVE
+
+
+# ----------------------------------
+# Én klient pr. proces – genbruger HTTP-forbindelserne mellem spørgsmål
+# ----------------------------------
+_client = None
+_client_lock = threading.Lock()
+_warm_up_started = False
+
+
+def get_client():
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            from ollama import Client
+            # Værten læses fra OLLAMA_HOST som ved Client()
+            _client = Client()
+        return _client
+
+
+def warm_up_model():
+    # En tom prompt får Ollama til at indlæse modellen uden at generere noget
+    get_client().generate(model=CHAT_MODEL, prompt="", keep_alive=_keep_alive())
+
+
+def start_model_warm_up():
+    # Kaldes ved app-start; kører i baggrunden så siden ikke venter på modellen
+    global _warm_up_started
+
+    with _client_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+
+    def run():
+        try:
+            warm_up_model()
+        except Exception:
+            pass  # Ollama kører ikke – chatbotten viser selv fejlen ved første spørgsmål
+
+    threading.Thread(target=run, name="ollama-warm-up", daemon=True).start()
+
+
+# ----------------------------------
+# Samtaler: historikken sendes uændret forrest, så Ollama kan genbruge den
+# allerede behandlede prompt (med keep_alive) og kun læser det nye til sidst.
+# Opfølgende spørgsmål får kun de fakta med, der ikke er sendt før.
+# ----------------------------------
+MAX_CONVERSATION_CHARS = 12000
+# Opfølgende spørgsmål har allerede samtalens fakta – de får et mindre tillæg
+FOLLOW_UP_FACTS = 6
+FOLLOW_UP_CHARS = 1500
+
+
+def new_conversation():
+    return {"messages": [], "facts": []}
+
+
+def _conversation_turn(question, conversation=None, with_facts=True):
+    # Returnerer (historik, nye beskeder, nye fakta) for dette spørgsmål
+    history = conversation["messages"] if conversation else []
+    sent = set(conversation["facts"]) if conversation else set()
+    if sum(len(m["content"]) for m in history) > MAX_CONVERSATION_CHARS:
+        # For lang til modellens kontekst – start forfra med kun systemprompten
+        history, sent = [], set()
+
+    turn, new_facts = [], []
+    if with_facts:
+        facts_by_section = retrieve_facts(question, FOLLOW_UP_FACTS, FOLLOW_UP_CHARS) if history else retrieve_facts(question)
+        selected = {section: [f for f in facts if f not in sent] for section, facts in facts_by_section.items()}
+        context = _format_context(selected)
+        if context:
+            intro = "More facts from the datasets:\n" if history else "Relevant facts from the datasets:\n"
+            turn.append({"role": "user", "content": intro + context})
+            new_facts = [f for facts in selected.values() for f in facts]
+    turn.append({"role": "user", "content": question})
+
+    if not history:
+        history = [{"role": "system", "content": SYSTEM_PROMPT}]
+    return history, turn, new_facts
+
+
+def _remember_turn(conversation, history, turn, new_facts, answer):
+    if conversation is None:
+        return
+    if history is not conversation["messages"]:
+        conversation["facts"] = []   # ny samtale, eller den blev startet forfra
+    conversation["messages"] = history + turn + [{"role": "assistant", "content": answer}]
+    conversation["facts"] = conversation["facts"] + new_facts
+
+
+def build_messages(question, conversation=None):
+    history, turn, _ = _conversation_turn(question, conversation)
+    return history + turn
+
+
+# ----------------------------------
+# Færdige svar genbruges på tværs af sessioner, så længe data og model er de samme
+# ----------------------------------
+def normalize_question(question):
+    # Store/små bogstaver, tegnsætning og mellemrum ændrer ikke spørgsmålet
+    return " ".join(tokenize(question))
+
+
+def answer_key(question):
+    return (normalize_question(question), CHAT_MODEL, get_context_snapshot()["version"])
+
+
+def _generate_answer(messages, cache_key, cancel_event):
+    # Selve kaldet til Ollama; køres af scheduleren én gang pr. unikt spørgsmål
+    import httpx
+
+    stream = get_client().chat(model=CHAT_MODEL, messages=messages, stream=True, keep_alive=_keep_alive())
+    parts = []
+    completed = False
+    try:
+        for part in stream:
+            if cancel_event.is_set():
+                break
+            content = part['message']['content']
+            if content:
+                parts.append(content)
+                yield content
+        else:
+            completed = True
+    except httpx.ConnectError as e:
+        # ollama oversætter kun forbindelsesfejl for ikke-streamede kald
+        raise ConnectionError(str(e)) from e
+    finally:
+        stream.close()
+
+    # Kun hele svar gemmes – ikke et der blev afbrudt undervejs
+    if completed and cache_key is not None:
+        answer_cache.store(cache_key, "".join(parts))
+
+
+def stream_chatbot_answer(question, cancel_event=None, on_queue=None, conversation=None):
+    # Giver svaret stykke for stykke, mens modellen genererer det.
+    # Alle kald går gennem den fælles kø; identiske spørgsmål der allerede er
+    # i gang deler samme generation. on_queue(plads) kaldes mens der ventes.
+    # Sættes cancel_event, eller lukkes generatoren, forlader sessionen køen –
+    # og er den den sidste der venter på svaret, afbrydes kaldet til Ollama.
+    # Med en conversation (se new_conversation) bygger spørgsmålet videre på de
+    # tidligere, og samtalen opdateres når svaret er færdigt.
+    with span("chatbot: route"):
+        answer = answer_structured(question)
+    if answer is not None:
+        history, turn, new_facts = _conversation_turn(question, conversation, with_facts=False)
+        yield answer
+        _remember_turn(conversation, history, turn, new_facts, answer)
+        return
+
+    with span("chatbot: context"):
+        history, turn, new_facts = _conversation_turn(question, conversation)
+        key = answer_key(question)
+    # Kun første spørgsmål i en samtale kan deles med andre sessioner
+    first_turn = len(history) == 1
+    if first_turn:
+        answer = answer_cache.lookup(key)
+        if answer is not None:
+            yield answer
+            _remember_turn(conversation, history, turn, new_facts, answer)
+            return
+    else:
+        key = key + (hashlib.sha1(json.dumps(history, ensure_ascii=False).encode("utf-8")).hexdigest(),)
+
+    messages = history + turn
+    flight = llm_scheduler.submit(key, lambda cancel: _generate_answer(messages, key if first_turn else None, cancel))
+    parts = []
+    for chunk in llm_scheduler.stream(flight, cancel_event=cancel_event, on_queue=on_queue):
+        parts.append(chunk)
+        yield chunk
+    if cancel_event is None or not cancel_event.is_set():
+        _remember_turn(conversation, history, turn, new_facts, "".join(parts))
+
+
+def ask_chatbot_about_data(question, on_queue=None, conversation=None):
+    return "".join(stream_chatbot_answer(question, on_queue=on_queue, conversation=conversation))
+
 
 # Alias til bagudkompatibilitet
 ask_chatbot_about_salary = ask_chatbot_about_data
+
+
+# ----------------------------------
+# Linjer til performance-panelet – tællerne er fælles for alle sessioner
+# ----------------------------------
+def _answer_cache_caption():
+    answers = answer_cache.answer_cache_stats()
+    return (f"Chatbot answers (all sessions, since start): {answers['hits']} hits / {answers['misses']} misses "
+            f"({answers['hit_rate']:.0%}), {answers['entries']} cached")
+
+
+def _llm_queue_caption():
+    llm = llm_scheduler.scheduler_stats()
+    return (f"LLM queue (all sessions): {llm['running']}/{llm['max_concurrent']} running, {llm['queued']} waiting, "
+            f"{llm['shared']} shared; wait avg {llm['avg_wait_s']:.1f} s, p95 {llm['p95_wait_s']:.1f} s")
+
+
+register_panel_stats("chatbot answers", _answer_cache_caption)
+register_panel_stats("llm queue", _llm_queue_caption)
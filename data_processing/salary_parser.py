@@ -1,33 +1,27 @@
+import pandas as pd
+from utils.salary_cube import workbook_slice_for_path, parse_salary_workbook, find_category
+
 def parse_salary_data(file_path: str, lønkategori: str, year: str):
     try:
-        df = pd.read_excel(file_path, sheet_name="LONS30", header=None)
-        df = df.dropna(how="all").dropna(axis=1, how="all")
+        # Slå op i løn-kuben – kun ukendte filer parses direkte
+        df = workbook_slice_for_path(file_path)
+        if df is None:
+            df = parse_salary_workbook(file_path).set_index("category_norm")
 
         lønkategori_clean = lønkategori.lower().strip()
 
         if year == "2023":
-            df[3] = df[3].fillna("ukendt kategori").astype(str).str.strip().str.lower()
-            match_row = df[df[3].str.contains(lønkategori_clean, na=False)]
-            if match_row.empty:
+            match_row = find_category(df, lønkategori_clean)
+            if match_row is None:
                 return None, f"⚠️ '{lønkategori}' ikke fundet i 2023-filen."
-            værdier = match_row.iloc[0, 4:9]
             sektorer = ["Sektorer i alt", "Stat", "Regioner", "Kommuner", "Virksomheder"]
         else:
-            df[2] = df[2].fillna("ukendt kategori").astype(str).str.strip().str.lower()
-            match_row = df[df[2] == lønkategori_clean]
-            if match_row.empty:
+            match_row = find_category(df, lønkategori_clean, exact=True)
+            if match_row is None:
                 return None, f"⚠️ '{lønkategori}' ikke fundet i filen."
-            row_idx = match_row.index[0]
-            værdier = df.loc[row_idx, 3:8]
-
-            # Forsøg at finde sektorer dynamisk
-            sektor_row = df[df.apply(lambda row: row.astype(str).str.contains("sektor", case=False).any(), axis=1)]
-            if not sektor_row.empty:
-                sektorer = sektor_row.iloc[0, 3:8].tolist()
-            else:
-                sektorer = ["Sektor 1", "Sektor 2", "Sektor 3", "Sektor 4", "Sektor 5"]
+            sektorer = match_row["sector"].tolist()
 
-        værdier_numeric = pd.to_numeric(værdier, errors='coerce')
+        værdier_numeric = match_row["value"]
         if værdier_numeric.isnull().any():
             return None, "❌ Ikke-numeriske eller manglende værdier fundet i løndataene."
 
@@ -1,10 +1,18 @@
+import pandas as pd
 import streamlit as st
+from utils.perf import start_rerun, span, show_performance_panel
+
+# ----- Pandas: Copy-on-Write for hele appen -----
+# Fælles data (fx SU-datasættet) udleveres som lette kopier, der først kopierer
+# tallene, når en visning skriver i dem. Sættes her én gang, før noget indlæses.
+pd.options.mode.copy_on_write = True
 
 # ----- Import tabs -----
 from tabs.salary import show_salary_tab
 from tabs.SU.su_tab import show_su_tab
 from tabs.food import show_food_tab
 from tabs.chatbot import show_chatbot_tab
+from chatbot_logic import start_model_warm_up
 from tabs.rent import show_rent_tab
 
 # ----- Import comparison views -----
@@ -109,38 +117,21 @@ def show_intro_tab():
     - 🧑‍💼 **Unions and employers**
     """)
 
-    st.success("➡️ Use the top tabs to explore data on wages, student support, food prices, and comparisons.")
+    st.success("➡️ Use the navigation at the top to explore data on wages, student support, food prices, and comparisons.")
 
 # ------------------------------------------------------------------
 
 # ----- Streamlit page setup -----
 st.set_page_config(page_title="Inflation & Economy", layout="wide")
+start_rerun()
+
+# Indlæs sprogmodellen i baggrunden, så første spørgsmål ikke venter på den
+start_model_warm_up()
+
 st.title("📊 BI Project – How Inflation Affects Society")
 
-# ----- Tabs for navigation -----
-tabs = st.tabs([
-    "📌 Intro",         # tab0
-    "💼 Salary",       # tab1
-    "🎓 SU",           # tab2
-    "🛒 Food",         # tab3
-    "🏡 Rent",         # tab4
-    "🤖 Chatbot",      # tab5
-    "📊 Comparison"    # tab6
-])
-
-with tabs[0]:
-    show_intro_tab()
-with tabs[1]:
-    show_salary_tab()
-with tabs[2]:
-    show_su_tab()
-with tabs[3]:
-    show_food_tab()
-with tabs[4]:
-    show_rent_tab()
-with tabs[5]:
-    show_chatbot_tab()
-with tabs[6]:
+# ----- Comparison tab -----
+def show_comparison_tab():
     st.header("📊 Comparison Subsections")
 
     sub_tab = st.radio(
@@ -166,5 +157,29 @@ with tabs[6]:
     elif sub_tab == "Rent vs Food Inflation":
         compare_rent_vs_food()
 
-    
 
+# ----- Navigation -----
+# st.tabs kører alle faner ved hver rerun – her køres kun den valgte side
+PAGES = {
+    "📌 Intro": show_intro_tab,
+    "💼 Salary": show_salary_tab,
+    "🎓 SU": show_su_tab,
+    "🛒 Food": show_food_tab,
+    "🏡 Rent": show_rent_tab,
+    "🤖 Chatbot": show_chatbot_tab,
+    "📊 Comparison": show_comparison_tab,
+}
+
+page = st.radio(
+    "Navigation",
+    options=list(PAGES),
+    horizontal=True,
+    label_visibility="collapsed",
+    key="page"
+)
+st.markdown("---")
+
+with span(f"page: {page}"):
+    PAGES[page]()
+
+show_performance_panel()
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
-from scipy.stats import zscore
+from utils.excel_cache import read_excel
+from utils.memo_cache import memoize
+from utils.perf import timed
 
 def clean_df(df):
     df.columns = df.columns.str.strip()
@@ -51,12 +53,13 @@ def label_ordinal_years(df):
                           labels=['Early', 'Middle', 'Late'])
     return df
 
+@timed("load: SU data")
 def load_and_clean_data(file_stipend, file_antal, file_aarsvaerk, file_home, file_not_home):
-    stipend_df = clean_df(pd.read_excel(file_stipend))
-    antal_df = clean_df(pd.read_excel(file_antal))
-    aarsvaerk_df = clean_df(pd.read_excel(file_aarsvaerk))
-    home_df = clean_living_situation(pd.read_excel(file_home))
-    not_home_df = clean_living_situation(pd.read_excel(file_not_home))
+    stipend_df = clean_df(read_excel(file_stipend))
+    antal_df = clean_df(read_excel(file_antal))
+    aarsvaerk_df = clean_df(read_excel(file_aarsvaerk))
+    home_df = clean_living_situation(read_excel(file_home))
+    not_home_df = clean_living_situation(read_excel(file_not_home))
 
     stipend_df.rename(columns={
         'Stipendie_(mio._kr)': 'Stipendie',
@@ -98,7 +101,36 @@ def load_and_clean_data(file_stipend, file_antal, file_aarsvaerk, file_home, fil
 
     return merged_df, home_df, not_home_df
 
+
+# ----------------------------------
+# Ét fælles SU-datasæt i hele processen – SU-fanen og alle sammenligninger
+# får det samme, bygget én gang pr. version af filerne
+# ----------------------------------
+SU_FILES = {
+    "file_stipend": "Data/SU/SU stipendier og lån (mio. kr.).xlsx",
+    "file_antal": "Data/SU/Antal støttemodtagere og låntagere.xlsx",
+    "file_aarsvaerk": "Data/SU/Støtteårsværk.xlsx",
+    "file_home": "Data/SU/students_living_at_home.xlsx",
+    "file_not_home": "Data/SU/students_not_living_at_home.xlsx",
+}
+
+
+@memoize(key=lambda: "SU", files=lambda: list(SU_FILES.values()), copy=False)
+def _shared_su_dataset():
+    return load_and_clean_data(**SU_FILES)
+
+
+def get_su_dataset():
+    # Returnerer (df, home_df, not_home_df). Med Copy-on-Write (slået til i main_app)
+    # er det lette kopier, der først kopierer tallene, når en forbruger skriver i dem.
+    # Uden – fx når modulet bruges uden appen – kopieres tallene, så det delte
+    # datasæt aldrig kan ændres af en forbruger.
+    deep = not pd.options.mode.copy_on_write
+    return tuple(df.copy(deep=deep) for df in _shared_su_dataset())
+
+@timed("clean: SU outliers")
 def remove_outliers(df, cols, z_thresh=3):
+    from scipy.stats import zscore
     z_scores = np.abs(zscore(df[cols], nan_policy='omit'))
     mask = (z_scores < z_thresh).all(axis=1)
     return df[mask]
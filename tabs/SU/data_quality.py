@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from .data_loading import remove_outliers
+from utils.perf import timed
 
 def analyze_missing_values(df):
     missing_summary = df.isnull().sum()
@@ -11,6 +12,7 @@ def analyze_missing_values(df):
         'Missing %': missing_percent
     }).sort_values(by='Missing Values', ascending=False)
 
+@timed("clean: SU imputation")
 def impute_selected_columns(df, cols, method='mean'):
     df = df.copy()
     for col in cols:
@@ -1,5 +1,5 @@
 import streamlit as st
-import matplotlib.pyplot as plt
+from utils.figures import show_figure, subplots
 
 
 def plot_living_situation(home_df, not_home_df, year_range):
@@ -8,7 +8,7 @@ def plot_living_situation(home_df, not_home_df, year_range):
         combined = home_df.merge(not_home_df, on='Aar', suffixes=('_at_home', '_not_home'))
         combined = combined[(combined['Aar'] >= year_range[0]) & (combined['Aar'] <= year_range[1])]
 
-        fig, ax = plt.subplots(figsize=(10, 5))
+        fig, ax = subplots(figsize=(10, 5))
         ax.plot(combined['Aar'], combined['Count_at_home'], marker='o', label='Living at Home', color='blue')
         ax.plot(combined['Aar'], combined['Count_not_home'], marker='o', label='Not Living at Home', color='green')
         ax.set_xlabel('Year')
@@ -16,7 +16,7 @@ def plot_living_situation(home_df, not_home_df, year_range):
         ax.set_title('Student Living Situation Over Time')
         ax.legend()
         ax.grid(True)
-        st.pyplot(fig)
+        show_figure(fig)
 
         if st.checkbox("Show living situation data"):
             st.dataframe(combined)
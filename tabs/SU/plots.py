@@ -1,11 +1,10 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
+from utils.figures import show_figure, subplots
 
 # line chart for SU metrics
 def plot_line_chart(df_filtered):
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = subplots(figsize=(10, 5))
     ax.plot(df_filtered['Aar'], df_filtered['SU_pr_student'], marker='o', color='teal', label='Total SU per student')
     ax.plot(df_filtered['Aar'], df_filtered['SU_pr_handicap'], marker='o', color='orange', label='Handicap tillæg per student')
     ax.plot(df_filtered['Aar'], df_filtered['SU_pr_forsorger'], marker='o', color='purple', label='Forsørger tillæg per student')
@@ -15,7 +14,7 @@ def plot_line_chart(df_filtered):
     ax.legend()
     ax.grid(True)
     fig.tight_layout()
-    st.pyplot(fig)
+    show_figure(fig)
 
 # Summary statistics
 def show_conclusions_for_plot_line_chart(df_filtered):
@@ -26,6 +25,7 @@ def show_conclusions_for_plot_line_chart(df_filtered):
 
 # Boxplot for distribution across years
 def plot_boxplot(df_filtered):
+    import seaborn as sns
     data = pd.melt(df_filtered,
                    id_vars='Aar',
                    value_vars=['SU_pr_student', 'SU_pr_handicap', 'SU_pr_forsorger'],
@@ -36,27 +36,28 @@ def plot_boxplot(df_filtered):
     data['Type'] = pd.Categorical(data['Type'], categories=type_order, ordered=True)
     data['Type'] = data['Type'].cat.rename_categories(labels)
 
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig, ax = subplots(figsize=(14, 7))
     sns.boxplot(x='Aar', y='Amount', hue='Type', data=data, ax=ax, palette='Set2')
     ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
     ax.set_title('Distribution of SU Types per Year')
     fig.tight_layout()
-    st.pyplot(fig)
+    show_figure(fig)
 
     if st.checkbox("Show boxplot data summary"):
         st.dataframe(data.groupby('Type')['Amount'].describe())
 
 # Correlation matrix of selected features
 def plot_correlation_heatmap(df):
+    import seaborn as sns
     st.subheader("Correlation Heatmap (Selected Features)")
     cols = ['Aar', 'Antal_stoettemodtagere', 'Antal_handicap_tillaeg', 'Antal_forsorger_tillaeg', 'SU_pr_student']
     corr = df[cols].corr()
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig, ax = subplots(figsize=(8, 6))
     sns.heatmap(corr, annot=True, cmap="coolwarm", ax=ax, annot_kws={"size": 10})
-    plt.xticks(rotation=45)
-    plt.yticks(rotation=0)
+    ax.tick_params(axis="x", rotation=45)
+    ax.tick_params(axis="y", rotation=0)
     ax.set_title("Correlation Matrix (Selected Features)")
-    st.pyplot(fig)
+    show_figure(fig)
 
 # Calculate year-over-year growth rates
 def calculate_growth_rates(df, columns):
@@ -75,7 +76,7 @@ def show_growth_rates(df):
         st.dataframe(growth_df[['Aar'] + [f'{col}_growth_rate' for col in columns]].round(2))
 
     if st.checkbox("Plot growth rates"):
-        fig, ax = plt.subplots(figsize=(10, 5))
+        fig, ax = subplots(figsize=(10, 5))
         for col, label, color in zip(columns,
                                      ['Total SU', 'Handicap Tillæg', 'Forsørger Tillæg'],
                                      ['teal', 'orange', 'purple']):
@@ -86,7 +87,7 @@ def show_growth_rates(df):
         ax.legend()
         ax.grid(True)
         fig.tight_layout()
-        st.pyplot(fig)
+        show_figure(fig)
 
 # Show total growth and CAGR for SU metrics 
 def show_su_growth_summary(df):
@@ -1,12 +1,11 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.metrics import mean_squared_error, r2_score
 import pandas as pd
+from utils.perf import timed
+from utils.figures import show_figure, show_cached_figure, subplots
+from .regression_engine import SU_TARGETS, fit_su_regressions, predict
 
+@timed("SU: linear regression prediction")
 def linear_regression_prediction(df_filtered):
     st.markdown("""
     ### 📈 What This Regression Section Does
@@ -28,38 +27,37 @@ def linear_regression_prediction(df_filtered):
     model_type = st.selectbox("Choose regression model:", ["Linear", "Polynomial"])
     degree = 1
 
+    # Alle mål og grader er fittet på én gang (og caches) – her evalueres kun polynomier
+    fit = fit_su_regressions(df_filtered)
+    X = fit["years"]
+
     for col, label, color in zip(
         ['SU_pr_student', 'SU_pr_handicap', 'SU_pr_forsorger'],
         ['Total SU per student', 'Handicap tillæg', 'Forsørger tillæg'],
         ['teal', 'orange', 'purple']
     ):
-        X = df_filtered[['Aar']].values
-        y = df_filtered[col].values
+        y = fit["values"][:, fit["targets"].index(col)]
 
         if model_type == "Polynomial":
             degree = st.slider(f"Select polynomial degree for {label}:", 2, 5, 2)
-            poly = PolynomialFeatures(degree=degree)
-            X_poly = poly.fit_transform(X)
-            model = LinearRegression()
-            model.fit(X_poly, y)
-            pred = model.predict(poly.transform([[future_year]]))[0]
-            y_pred = model.predict(X_poly)
-        else:
-            model = LinearRegression()
-            model.fit(X, y)
-            pred = model.predict([[future_year]])[0]
-            y_pred = model.predict(X)
+
+        pred = predict(fit, col, degree, future_year)
+        y_pred = predict(fit, col, degree, X)
 
         st.write(f"\n📈 Predicted {label} for {future_year}: {pred:,.0f} DKK")
 
-        fig, ax = plt.subplots(figsize=(10, 4))
-        ax.scatter(X.flatten(), y, color=color)
-        ax.plot(X.flatten(), y_pred, linestyle='--', color='black')
+        fig, ax = subplots(figsize=(10, 4))
+        ax.scatter(X, y, color=color)
+        ax.plot(X, y_pred, linestyle='--', color='black')
         ax.scatter(future_year, pred, color='red', marker='X', s=100)
         ax.set_title(f"Prediction of {label} using {model_type} Regression")
-        st.pyplot(fig)
+        show_figure(fig)
 
+@timed("SU: train test model analysis")
 def train_test_model_analysis(df):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.model_selection import train_test_split, cross_val_score
+    from sklearn.metrics import mean_squared_error, r2_score
     st.subheader("Train/Test Split and Model Accuracy")
 
     feature_cols = ['Aar', 'Antal_stoettemodtagere', 'Antal_handicap_tillaeg', 'Antal_forsorger_tillaeg']
@@ -82,13 +80,13 @@ def train_test_model_analysis(df):
     st.write(f"Cross-validated R² (5-fold): {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
 
     residuals = y_test - predictions
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = subplots(figsize=(8, 5))
     ax.scatter(predictions, residuals, alpha=0.7)
     ax.axhline(0, color='red', linestyle='--')
     ax.set_xlabel("Predicted Values")
     ax.set_ylabel("Residuals")
     ax.set_title("Residual Plot")
-    st.pyplot(fig)
+    show_figure(fig)
 
     coef_df = pd.DataFrame({
         'Feature': feature_cols,
@@ -97,6 +95,7 @@ def train_test_model_analysis(df):
     st.subheader("Feature Importance (Linear Regression Coefficients)")
     st.dataframe(coef_df)
 
+@timed("SU: compare regression models")
 def compare_regression_models(df_filtered):
     st.subheader("📊 Compare Regression Models")
     st.markdown("""
@@ -109,40 +108,26 @@ def compare_regression_models(df_filtered):
         ['Total SU per student', 'Handicap tillæg', 'Forsørger tillæg'],
         ['teal', 'orange', 'purple']
     ):
-        X = df_filtered[['Aar']].values
-        y = df_filtered[col].values
-
-        X_range = np.linspace(X.min(), X.max(), 300).reshape(-1, 1)
-
-        # Linear
-        lin_model = LinearRegression()
-        lin_model.fit(X, y)
-        y_pred_lin = lin_model.predict(X_range)
-
-        # Polynomial deg 2
-        poly2 = PolynomialFeatures(degree=2)
-        X_poly2 = poly2.fit_transform(X)
-        poly2_model = LinearRegression()
-        poly2_model.fit(X_poly2, y)
-        y_pred_poly2 = poly2_model.predict(poly2.transform(X_range))
-
-        # Polynomial deg 3
-        poly3 = PolynomialFeatures(degree=3)
-        X_poly3 = poly3.fit_transform(X)
-        poly3_model = LinearRegression()
-        poly3_model.fit(X_poly3, y)
-        y_pred_poly3 = poly3_model.predict(poly3.transform(X_range))
-
-        # Plot
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.scatter(X, y, color=color, label="Actual", alpha=0.7)
-        ax.plot(X_range, y_pred_lin, '--', label="Linear", color='black')
-        ax.plot(X_range, y_pred_poly2, label="Polynomial (deg 2)", color='blue')
-        ax.plot(X_range, y_pred_poly3, label="Polynomial (deg 3)", color='green')
-
-        ax.set_title(f"Model Comparison: {label}")
-        ax.set_xlabel("Year")
-        ax.set_ylabel("Amount (DKK)")
-        ax.legend()
-        ax.grid(True)
-        st.pyplot(fig)
+        def draw(col=col, label=label, color=color):
+            fit = fit_su_regressions(df_filtered)
+            X = fit["years"]
+            y = fit["values"][:, fit["targets"].index(col)]
+
+            X_range = np.linspace(X.min(), X.max(), 300)
+
+            # Plot
+            fig, ax = subplots(figsize=(10, 5))
+            ax.scatter(X, y, color=color, label="Actual", alpha=0.7)
+            ax.plot(X_range, predict(fit, col, 1, X_range), '--', label="Linear", color='black')
+            ax.plot(X_range, predict(fit, col, 2, X_range), label="Polynomial (deg 2)", color='blue')
+            ax.plot(X_range, predict(fit, col, 3, X_range), label="Polynomial (deg 3)", color='green')
+
+            ax.set_title(f"Model Comparison: {label}")
+            ax.set_xlabel("Year")
+            ax.set_ylabel("Amount (DKK)")
+            ax.legend()
+            ax.grid(True)
+            return fig
+
+        # Fittet dropper rækker med NaN i et hvilket som helst mål, så nøglen dækker alle mål
+        show_cached_figure("SU model comparison", [df_filtered[['Aar'] + SU_TARGETS], col, label, color], draw)
@@ -0,0 +1,28 @@
+from utils.memo_cache import remember, data_fingerprint
+from utils.perf import span
+from utils.poly_trend import fit_trend, predict_trend
+
+SU_TARGETS = ['SU_pr_student', 'SU_pr_handicap', 'SU_pr_forsorger']
+MAX_DEGREE = 5
+
+
+# ----------------------------------
+# Alle SU-mål og alle grader i ét fit på den skalerede årsakse (utils.poly_trend)
+# ----------------------------------
+def fit_su_regressions(df, targets=SU_TARGETS, max_degree=MAX_DEGREE):
+    # Cachet på årsinterval og data – en ny forudsigelse kræver kun polyval
+    data = df[['Aar'] + list(targets)].dropna()
+    years = data['Aar'].to_numpy(dtype=float)
+    key = (int(years.min()), int(years.max()), max_degree, data_fingerprint(data))
+
+    def compute():
+        with span("SU: batched regression fit"):
+            fit = fit_trend(years, data[list(targets)].to_numpy(dtype=float), max_degree)
+        fit.update(targets=list(targets), years=years, values=data[list(targets)].to_numpy(dtype=float))
+        return fit
+
+    return remember("SU regression fits", key, compute, copy=False)
+
+
+def predict(fit, target, degree, years):
+    return predict_trend(fit, years, degree, column=fit["targets"].index(target))
@@ -1,5 +1,5 @@
 import streamlit as st
-from .data_loading import load_and_clean_data
+from .data_loading import get_su_dataset
 from .data_quality import show_data_quality_checks
 from .plots import plot_line_chart, plot_boxplot, plot_correlation_heatmap, show_conclusions_for_plot_line_chart, show_growth_rates, show_su_growth_summary
 from .regression import linear_regression_prediction, train_test_model_analysis, compare_regression_models
@@ -28,13 +28,7 @@ def show_su_tab():
     </style>
     """, unsafe_allow_html=True)
 
-    file_stipend = 'Data/SU/SU stipendier og lån (mio. kr.).xlsx'
-    file_antal = 'Data/SU/Antal støttemodtagere og låntagere.xlsx'
-    file_aarsvaerk = 'Data/SU/Støtteårsværk.xlsx'
-    file_home = 'Data/SU/students_living_at_home.xlsx'
-    file_not_home = 'Data/SU/students_not_living_at_home.xlsx'
-
-    df, home_df, not_home_df = load_and_clean_data(file_stipend, file_antal, file_aarsvaerk, file_home, file_not_home)
+    df, home_df, not_home_df = get_su_dataset()
 
     year_min, year_max = int(df['Aar'].min()), int(df['Aar'].max())
     year_range = st.slider('🗕️ Select year range:', year_min, year_max, (year_min, year_max))
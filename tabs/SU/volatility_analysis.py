@@ -1,5 +1,5 @@
 import streamlit as st
-import matplotlib.pyplot as plt
+from utils.figures import show_figure, subplots
 
 def show_volatility_analysis(df):
     st.subheader("📉 Volatility Analysis of SU Growth")
@@ -16,14 +16,14 @@ def show_volatility_analysis(df):
     # drop NaNs for plotting volatility
     df_vol = df.dropna(subset=['SU_growth_volatility_3yr'])
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = subplots(figsize=(10, 5))
     ax.plot(df_vol['Aar'], df_vol['SU_growth_volatility_3yr'], label='3-Year Rolling Volatility')
     ax.set_xlabel("Year")
     ax.set_ylabel("Volatility (% Std Dev)")
     ax.set_title("SU Growth Volatility Over Time")
     ax.legend()
     ax.grid(True)
-    st.pyplot(fig)
+    show_figure(fig)
 
     avg_vol = df_vol['SU_growth_volatility_3yr'].mean()
     st.write(f"Average 3-year volatility over period (excluding NaNs): {avg_vol:.2f}%")
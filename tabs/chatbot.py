@@ -1,5 +1,25 @@
+import threading
+
 import streamlit as st
-from chatbot_logic import ask_chatbot_about_data  
+from chatbot_logic import ask_chatbot_about_data, stream_chatbot_answer, new_conversation
+
+
+def _new_cancel_event():
+    # Et nyt spørgsmål afbryder et svar der stadig streames
+    previous = st.session_state.get("chatbot_cancel")
+    if previous is not None:
+        previous.set()
+    event = threading.Event()
+    st.session_state["chatbot_cancel"] = event
+    return event
+
+
+def _reset_conversation():
+    # Kører før scriptet (on_click), så spørgsmålsfeltet kan tømmes med det samme
+    st.session_state["chatbot_conversation"] = new_conversation()
+    st.session_state.pop("chatbot_last", None)
+    st.session_state["chatbot_question"] = ""
+
 
 def show_chatbot_tab():
     st.subheader("🤖 Chatbot – Ask Questions About Economic Data")
@@ -13,10 +33,56 @@ def show_chatbot_tab():
     *E.g., "How have food prices changed?" or "What was the public sector salary in 2020?"*
     """)
 
-    user_question = st.text_input("🔍 What would you like to know?")
+    # Opfølgende spørgsmål bygger videre på sessionens samtale
+    if "chatbot_conversation" not in st.session_state:
+        st.session_state["chatbot_conversation"] = new_conversation()
+    conversation = st.session_state["chatbot_conversation"]
 
-    if user_question:
-        with st.spinner("Thinking..."):
-            response = ask_chatbot_about_data(user_question)
+    user_question = st.text_input("🔍 What would you like to know?", key="chatbot_question")
+    col1, col2 = st.columns([3, 1])
+    streaming = col1.toggle("Stream answer while it is generated", value=True, key="chatbot_streaming")
+    turns = sum(1 for m in conversation["messages"] if m["role"] == "assistant")
+    if turns:
+        col2.button("🧹 New conversation", on_click=_reset_conversation)
+        st.caption(f"Follow-up questions continue the conversation ({turns} earlier answer{'s' if turns != 1 else ''}).")
+
+    if not user_question:
+        return
+
+    # Samme spørgsmål ved et andet rerun: vis det færdige svar igen
+    last = st.session_state.get("chatbot_last")
+    if last is not None and last[0] == user_question:
+        st.success("Answer:")
+        st.write(last[1])
+        return
+
+    # Venter spørgsmålet i den fælles kø, vises pladsen indtil modellen går i gang
+    queue_note = st.empty()
+
+    def show_queue_position(position):
+        if position:
+            queue_note.info(f"⏳ The model is busy with other questions – you are number {position} in the queue.")
+        else:
+            queue_note.empty()
+
+    try:
+        if streaming:
+            cancel = _new_cancel_event()
             st.success("Answer:")
-            st.write(response)
+            stream = stream_chatbot_answer(user_question, cancel_event=cancel, on_queue=show_queue_position,
+                                            conversation=conversation)
+            try:
+                response = st.write_stream(stream)
+            finally:
+                stream.close()
+        else:
+            with st.spinner("Thinking..."):
+                response = ask_chatbot_about_data(user_question, on_queue=show_queue_position,
+                                                  conversation=conversation)
+                st.success("Answer:")
+                st.write(response)
+    except ConnectionError as e:
+        st.error(f"❌ Could not reach the language model: {e}")
+        return
+
+    st.session_state["chatbot_last"] = (user_question, response)
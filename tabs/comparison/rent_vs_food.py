@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from tabs.rent_presentations.rent_data import loadRentData
 from tabs.food_presentation.food_clean_data import load_and_clean  # brug versionen med inflation
+from utils.figures import show_figure, subplots
 
 def compare_rent_vs_food():
     st.title("🏡 Rent Index vs. 🛒 Food Inflation")
@@ -23,7 +23,7 @@ def compare_rent_vs_food():
     combined = pd.merge(rent_avg, food_avg, on="Year", how="inner")
 
     # Plot
-    fig, ax1 = plt.subplots(figsize=(10, 5))
+    fig, ax1 = subplots(figsize=(10, 5))
     ax1.plot(combined["Year"], combined["Rent Index"], marker="o", color="teal", label="Rent Index")
     ax1.set_ylabel("Rent Index", color="teal")
     ax1.tick_params(axis='y', labelcolor="teal")
@@ -36,7 +36,7 @@ def compare_rent_vs_food():
     ax1.set_xlabel("Year")
     ax1.set_title("Rent Index vs. Food Inflation")
     fig.tight_layout()
-    st.pyplot(fig)
+    show_figure(fig)
 
     st.markdown("""
     🔍 **Insight:**  
@@ -1,20 +1,14 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from tabs.rent_presentations.rent_data import loadRentData
-from tabs.SU.data_loading import load_and_clean_data
+from tabs.SU.data_loading import get_su_dataset
+from utils.figures import show_figure, subplots
 
 def compare_rent_vs_su():
     st.title("🏡 Rent Index vs. 🎓 SU per Student")
 
     df_rent = loadRentData("Data/Rent/Huslejeindeks_2021-2024.xlsx")
-    df_su, _, _ = load_and_clean_data(
-        "Data/SU/SU stipendier og lån (mio. kr.).xlsx",
-        "Data/SU/Antal støttemodtagere og låntagere.xlsx",
-        "Data/SU/Støtteårsværk.xlsx",
-        "Data/SU/students_living_at_home.xlsx",
-        "Data/SU/students_not_living_at_home.xlsx"
-    )
+    df_su, _, _ = get_su_dataset()
 
     su_data = df_su[["Aar", "SU_pr_student"]].copy()
     su_data = su_data[su_data["Aar"] >= 2021]
@@ -26,7 +20,7 @@ def compare_rent_vs_su():
 
     combined = pd.merge(su_data, rent_avg, on="Year", how="inner")
 
-    fig, ax1 = plt.subplots(figsize=(10, 5))
+    fig, ax1 = subplots(figsize=(10, 5))
     ax1.plot(combined["Year"], combined["SU_pr_student"], marker="o", color="green", label="SU per Student")
     ax1.set_ylabel("SU (DKK)", color="green")
     ax1.tick_params(axis='y', labelcolor="green")
@@ -39,7 +33,7 @@ def compare_rent_vs_su():
     ax1.set_xlabel("Year")
     ax1.set_title("SU per Student vs. Rent Index")
     fig.tight_layout()
-    st.pyplot(fig)
+    show_figure(fig)
 
     st.markdown("""
     🧾 **Insight:**  
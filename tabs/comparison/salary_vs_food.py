@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-from utils.salary_loader import load_salary_data
+from utils.salary_loader import load_salary_series
 from tabs.food_presentation.food_clean_data import load_and_clean
+from utils.figures import show_figure, subplots
 
 def run_salary_vs_food_comparison():
     st.title("💼 Salary vs 🛒 Food Prices and Inflation")
@@ -20,17 +20,11 @@ def run_salary_vs_food_comparison():
     group = st.selectbox("Select population group", ["All", "Men", "Women"])
 
     # --- Load salary data ---
-    salary_data = []
-    for year in food_avg["Year"]:
-        df, error = load_salary_data(group, str(year), wage_category)
-        if df is not None:
-            avg_salary = df["Timefortjeneste (kr)"].mean()
-            salary_data.append({"Year": year, "Avg Salary": round(avg_salary, 1)})
-
-    salary_df = pd.DataFrame(salary_data)
-    if salary_df.empty:
+    salary_series, error = load_salary_series(group, wage_category, food_avg["Year"].tolist())
+    if salary_series is None:
         st.error("No valid salary data found.")
         return
+    salary_df = salary_series.round(1).rename("Avg Salary").rename_axis("Year").reset_index()
 
     # --- Merge salary and food ---
     combined = pd.merge(salary_df, food_avg, on="Year", how="inner").sort_values("Year")
@@ -54,7 +48,7 @@ def run_salary_vs_food_comparison():
     # --- Main chart ---
     st.subheader("📈 Average Salary vs. Food Prices")
 
-    fig, ax1 = plt.subplots(figsize=(10, 5))
+    fig, ax1 = subplots(figsize=(10, 5))
     ax1.plot(combined["Year"], combined["Avg Salary"], marker="o", color="teal", label="Avg Salary (DKK/hour)")
     ax1.set_ylabel("Avg Salary (DKK)", color="teal")
     ax1.tick_params(axis='y', labelcolor="teal")
@@ -72,7 +66,7 @@ def run_salary_vs_food_comparison():
     ax1.set_title("Salary vs. Food Prices and Inflation")
     ax1.grid(True)
     fig.tight_layout()
-    st.pyplot(fig)
+    show_figure(fig)
 
     st.markdown("""
     📊 **Explanation:**  
@@ -83,12 +77,12 @@ def run_salary_vs_food_comparison():
 
     # --- Salary growth bar chart ---
     st.markdown("### 📉 Annual Salary Growth (%)")
-    fig2, ax2 = plt.subplots()
+    fig2, ax2 = subplots()
     ax2.bar(combined["Year"], combined["Salary_Growth"], color="skyblue")
     ax2.axhline(0, color="gray", linestyle="--")
     ax2.set_ylabel("Change (%)")
     ax2.set_title("Year-over-Year Salary Growth")
-    st.pyplot(fig2)
+    show_figure(fig2)
 
     st.markdown("""
     📘 **Insight:**  
@@ -98,12 +92,12 @@ def run_salary_vs_food_comparison():
 
     # --- Food inflation line chart ---
     st.markdown("### 🍲 Annual Food Inflation (%)")
-    fig3, ax3 = plt.subplots()
+    fig3, ax3 = subplots()
     ax3.plot(combined["Year"], combined["Food_Inflation"], marker='o', linestyle='-', color="orange")
     ax3.axhline(0, color="gray", linestyle="--")
     ax3.set_ylabel("Inflation (%)")
     ax3.set_title("Average Annual Change in Food Prices")
-    st.pyplot(fig3)
+    show_figure(fig3)
 
     st.markdown("""
     📙 **Insight:**  
@@ -113,12 +107,12 @@ def run_salary_vs_food_comparison():
 
     # --- Real wage growth chart ---
     st.markdown("### 💶 Real Salary Growth (adjusted for food inflation)")
-    fig4, ax4 = plt.subplots()
+    fig4, ax4 = subplots()
     ax4.plot(combined["Year"], combined["Real_Salary_Growth"], marker="d", color="green")
     ax4.axhline(0, color="red", linestyle="--")
     ax4.set_ylabel("Real Change (%)")
     ax4.set_title("Purchasing Power: Salary Growth Minus Food Inflation")
-    st.pyplot(fig4)
+    show_figure(fig4)
 
     st.markdown("""
     🧾 **Insight:**  
@@ -1,19 +1,13 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
 
-from tabs.SU.su_tab import load_and_clean_data as load_su_data
+from tabs.SU.data_loading import get_su_dataset
 from tabs.food_presentation.food_clean_data import load_and_clean as load_food_price_data
+from utils.figures import show_figure, subplots
 
 def prepare_combined_data():
     # Load SU data
-    su_df, _, _ = load_su_data(
-        file_stipend="Data/SU/SU stipendier og lån (mio. kr.).xlsx",
-        file_antal="Data/SU/Antal støttemodtagere og låntagere.xlsx",
-        file_aarsvaerk="Data/SU/Støtteårsværk.xlsx",
-        file_home="Data/SU/students_living_at_home.xlsx",
-        file_not_home="Data/SU/students_not_living_at_home.xlsx"
-    )
+    su_df, _, _ = get_su_dataset()
     
     # Load food price annual changes (percentages)
     _, food_data, years = load_food_price_data()
@@ -62,7 +56,7 @@ def prepare_combined_data():
 def plot_comparison(df_combined):
     st.header("📊 Comparison of SU Growth and Food Price Inflation (2014–2024)")
 
-    fig, ax1 = plt.subplots(figsize=(10, 5))
+    fig, ax1 = subplots(figsize=(10, 5))
     ax1.plot(df_combined['Year'], df_combined['SU_pr_student'], color='teal', marker='o', label='SU per Student (DKK)')
     ax1.set_xlabel('Year')
     ax1.set_ylabel('SU per Student (DKK)', color='teal')
@@ -81,11 +75,11 @@ def plot_comparison(df_combined):
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax2.legend(lines1 + lines2, labels1 + labels2, loc='upper left', fontsize=8)
 
-    plt.title('SU Amounts vs Food Price Inflation and Growth Rates')
-    plt.grid(True)
-    plt.tight_layout()
+    ax2.set_title('SU Amounts vs Food Price Inflation and Growth Rates')
+    ax2.grid(True)
+    fig.tight_layout()
 
-    st.pyplot(fig)
+    show_figure(fig)
 
 def summarize_by_period(df):
     st.subheader("📘 SU vs Inflation: Summary by Period")
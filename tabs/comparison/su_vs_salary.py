@@ -1,20 +1,14 @@
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-from utils.salary_loader import load_salary_data
-from tabs.SU.su_tab import load_and_clean_data as load_su_data
+from utils.salary_loader import load_salary_series
+from tabs.SU.data_loading import get_su_dataset
+from utils.figures import show_figure, subplots
 
 def run_su_vs_salary_comparison():
     st.title("🎓 SU vs 💼 Salary Comparison")
 
     # --- Load SU data ---
-    su_df, _, _ = load_su_data(
-        file_stipend="Data/SU/SU stipendier og lån (mio. kr.).xlsx",
-        file_antal="Data/SU/Antal støttemodtagere og låntagere.xlsx",
-        file_aarsvaerk="Data/SU/Støtteårsværk.xlsx",
-        file_home="Data/SU/students_living_at_home.xlsx",
-        file_not_home="Data/SU/students_not_living_at_home.xlsx"
-    )
+    su_df, _, _ = get_su_dataset()
 
     # --- Prepare SU data ---
     su_df = su_df[["Aar", "SU_pr_student"]].copy()
@@ -24,14 +18,12 @@ def run_su_vs_salary_comparison():
 
     # --- Load Salary data for same years ---
     wage_category = "standardberegnet timefortjeneste"
-    salary_data = []
-    for year in su_df["Year"]:
-        df, error = load_salary_data("All", str(year), wage_category)
-        if df is not None:
-            avg_salary = df["Timefortjeneste (kr)"].mean()
-            salary_data.append({"Year": year, "Avg Salary": round(avg_salary, 1)})
-
-    salary_df = pd.DataFrame(salary_data)
+    salary_series, error = load_salary_series("All", wage_category, su_df["Year"].tolist())
+    if salary_series is None:
+        st.error(error)
+        return
+
+    salary_df = salary_series.round(1).rename("Avg Salary").rename_axis("Year").reset_index()
     salary_df = salary_df.sort_values("Year")
     salary_df["Salary_Growth_pct"] = salary_df["Avg Salary"].pct_change() * 100
 
@@ -53,7 +45,7 @@ def run_su_vs_salary_comparison():
 
     # --- Main chart: SU value and growth comparison ---
     st.subheader("📈 SU Amount and Growth vs. Salary Growth")
-    fig, ax1 = plt.subplots(figsize=(10, 5))
+    fig, ax1 = subplots(figsize=(10, 5))
     ax1.plot(combined["Year"], combined["SU_pr_student"], marker="o", color="teal", label="SU per Student (DKK)")
     ax1.set_ylabel("SU per Student (DKK)", color="teal")
     ax1.tick_params(axis='y', labelcolor="teal")
@@ -69,11 +61,11 @@ def run_su_vs_salary_comparison():
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax2.legend(lines1 + lines2, labels1 + labels2, loc="upper left", fontsize=8)
 
-    plt.title("SU vs. Salary Growth Rates")
+    ax2.set_title("SU vs. Salary Growth Rates")
     ax1.set_xlabel("Year")
     ax1.grid(True)
     fig.tight_layout()
-    st.pyplot(fig)
+    show_figure(fig)
 
     st.markdown("""
     📊 **Explanation:**  
@@ -85,12 +77,12 @@ def run_su_vs_salary_comparison():
 
     # --- Bar chart: SU growth ---
     st.markdown("### 🟧 SU Growth (%)")
-    fig_su, ax_su = plt.subplots()
+    fig_su, ax_su = subplots()
     ax_su.bar(combined["Year"], combined["SU_growth_pct"], color="orange")
     ax_su.axhline(0, color="gray", linestyle="--")
     ax_su.set_ylabel("Growth (%)")
     ax_su.set_title("Annual SU Growth")
-    st.pyplot(fig_su)
+    show_figure(fig_su)
 
     st.markdown("""
     🧾 **Insight:**  
@@ -100,12 +92,12 @@ def run_su_vs_salary_comparison():
 
     # --- Bar chart: Salary growth ---
     st.markdown("### 📈 Salary Growth (%)")
-    fig_sal, ax_sal = plt.subplots()
+    fig_sal, ax_sal = subplots()
     ax_sal.bar(combined["Year"], combined["Salary_Growth_pct"], color="skyblue")
     ax_sal.axhline(0, color="gray", linestyle="--")
     ax_sal.set_ylabel("Growth (%)")
     ax_sal.set_title("Annual Salary Growth")
-    st.pyplot(fig_sal)
+    show_figure(fig_sal)
 
     st.markdown("""
     📘 **Insight:**  
@@ -114,12 +106,12 @@ def run_su_vs_salary_comparison():
 
     # --- Real Salary vs SU growth line ---
     st.markdown("### 💶 Real Salary Growth vs SU")
-    fig_real, ax_real = plt.subplots()
+    fig_real, ax_real = subplots()
     ax_real.plot(combined["Year"], combined["Real_Salary_Growth_vs_SU"], color="green", marker="d")
     ax_real.axhline(0, color="red", linestyle="--")
     ax_real.set_ylabel("Difference (%)")
     ax_real.set_title("Salary Growth – SU Growth")
-    st.pyplot(fig_real)
+    show_figure(fig_real)
 
     st.markdown("""
     🧠 **Interpretation:**  
@@ -3,21 +3,28 @@ import streamlit as st
 import matplotlib.pyplot as plt
 import os
 import re
-from scipy.stats.mstats import winsorize
+from utils.excel_cache import read_excel
+from utils.memo_cache import memoize
+from utils.perf import timed
 
+PRICE_FILE = "Data/Food/FoodPricesComparedToPreviousYear.xlsx"
+
+@timed("load: food prices")
+@memoize(files=lambda: [PRICE_FILE])
 def load_and_clean():
+    from scipy.stats.mstats import winsorize
 
 # --- FILE PATH ---
-    file_path = "Data/Food/FoodPricesComparedToPreviousYear.xlsx"
+    file_path = PRICE_FILE
 
     if not os.path.exists(file_path):
         st.error(f"File not found: {file_path}")
         st.stop()
 
-    # --- LOAD HEADERS ---
-    raw = pd.read_excel(file_path, header=None)
-    temp = pd.read_excel(file_path, header=None, nrows=3)
-    years = temp.iloc[2, 2:].tolist()
+    # --- LOAD WORKBOOK ONCE ---
+    # Header, årstal og datablok tages alle fra det samme rå gitter
+    raw = read_excel(file_path, header=None)
+    years = raw.iloc[2, 2:].tolist()
 
     # ── Step 2: keep only those entries that start with 4 digits
     year_rx = re.compile(r"^(\d{4})")
@@ -32,7 +39,7 @@ def load_and_clean():
         st.stop()
 
     # --- DATA LOADING ---
-    df = pd.read_excel(file_path, skiprows=3, header=None).iloc[:, 1:].copy()
+    df = raw.iloc[3:, 1:].reset_index(drop=True).infer_objects()
 
     df.replace(r"^[\.\s]+$", pd.NA, regex=True, inplace=True)
 
@@ -1,20 +1,27 @@
 import pandas as pd
 import streamlit as st
 import os
+from utils.excel_cache import read_excel
+from utils.memo_cache import memoize
+from utils.perf import timed
 
+EXPENDITURE_FILE = "Data/Food/AverageHouseholdConsumption.xlsx"
+
+@timed("load: food expenditure")
+@memoize(files=lambda: [EXPENDITURE_FILE])
 def load_and_clean_expenditure():
     
-    file_path = "Data/Food/AverageHouseholdConsumption.xlsx"
+    file_path = EXPENDITURE_FILE
     if not os.path.exists(file_path):
         st.error(f"File not found: {file_path}")
         st.stop()
 
-    # --- find årstal i header ---
-    temp = pd.read_excel(file_path, header=None)
+    # --- indlæs projektmappen én gang og find årstal i header ---
+    temp = read_excel(file_path, header=None)
     years = temp.iloc[2, 2:].tolist()  # 2014, 2015, ...
 
-    # --- indlæs rå data, spring 3 rækker over ---
-    raw = pd.read_excel(file_path, skiprows=3, header=None)
+    # --- rå data: alt efter de 3 header-rækker i samme gitter ---
+    raw = temp.iloc[3:].reset_index(drop=True).infer_objects()
 
     # --- vælg B-kolonne (Category) og C-Kolonner (år) ---
     data = raw.iloc[:, 1:].copy()
@@ -1,11 +1,11 @@
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
 import os
-from scipy.stats.mstats import winsorize
 from tabs.food_presentation.food_clean_data import load_and_clean
+from utils.figures import show_figure, subplots
 
 def show_cleaning():
+    from scipy.stats.mstats import winsorize
 
     df, data, years = load_and_clean()
 
@@ -80,7 +80,7 @@ def show_cleaning():
 
 
     # Plot side-by-side
-    fig, axes = plt.subplots(1, 2, figsize=(6, 2), constrained_layout=True)
+    fig, axes = subplots(1, 2, figsize=(6, 2), constrained_layout=True)
     xmin, xmax = -10, 15
 
     axes[0].hist(vals_orig.values, bins=10, color='skyblue')
@@ -94,7 +94,7 @@ def show_cleaning():
     for ax in axes:
         ax.tick_params(axis='both', labelsize=6)
 
-    st.pyplot(fig, use_container_width=False)
+    show_figure(fig, use_container_width=False)
 
 
     st.markdown("""
@@ -141,7 +141,7 @@ These statistics help identify whether a category has had stable or volatile pri
 
 
     st.subheader("📊 Value distribution")
-    fig2, ax2 = plt.subplots(figsize=(4, 2), dpi=200, constrained_layout=True)
+    fig2, ax2 = subplots(figsize=(4, 2), dpi=200, constrained_layout=True)
     ax2.hist(example_values.dropna(), bins=10, color='skyblue')
     ax2.set_title("Distribution of annual price changes", fontsize=8)
     ax2.set_xlabel("Change (%)", fontsize=6)
@@ -150,7 +150,7 @@ These statistics help identify whether a category has had stable or volatile pri
     ax2.tick_params(axis='x', labelsize=7)
     ax2.tick_params(axis='y', labelsize=7)
     # now hand it off to Streamlit at its native size
-    st.pyplot(fig2, use_container_width=False)
+    show_figure(fig2, use_container_width=False)
 
     st.markdown("""
 The histogram shows that most annual price changes are small,  
@@ -1,14 +1,15 @@
 import pandas as pd
 import numpy as np
 import streamlit as st
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import TimeSeriesSplit, cross_val_score
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
-import matplotlib.pyplot as plt
 from tabs.food_presentation.food_clean_data import load_and_clean          
 from tabs.food_presentation.food_clean_data_expenditure import load_and_clean_expenditure 
+from utils.perf import span
+from utils.figures import show_figure, subplots
 
 def show_forecast():
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.model_selection import TimeSeriesSplit, cross_val_score
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
     st.header("🔮 Food Prices & Expenditure Forecasting (Machine Learning)")
 
@@ -59,16 +60,18 @@ def show_forecast():
     tscv = TimeSeriesSplit(n_splits=3)
     model = RandomForestRegressor(n_estimators=100, random_state=42)
 
-    scores = cross_val_score(
-        model, X, y, 
-        cv=tscv, 
-        scoring="neg_root_mean_squared_error"
-    )
+    with span("fit: food RandomForest CV"):
+        scores = cross_val_score(
+            model, X, y, 
+            cv=tscv, 
+            scoring="neg_root_mean_squared_error"
+        )
     rmse = -scores.mean()
     st.write(f"📈 Cross-validated RMSE: {rmse:.2f} DKK")
 
     # 5) Train final model
-    model.fit(X, y)
+    with span("fit: food RandomForest"):
+        model.fit(X, y)
 
     # 6) Show feature importances
     importances = model.feature_importances_
@@ -85,7 +88,7 @@ def show_forecast():
 
     # 7) Plot actual vs. predicted
     y_pred = model.predict(X)
-    fig, ax = plt.subplots(figsize=(4, 3), dpi=120)
+    fig, ax = subplots(figsize=(4, 3), dpi=120)
     ax.scatter(y, y_pred, s=15, alpha=0.7)
     lims = [min(y.min(), y_pred.min()), max(y.max(), y_pred.max())]
     ax.plot(lims, lims, "--", color="grey", linewidth=1)
@@ -93,7 +96,7 @@ def show_forecast():
     ax.set_ylabel("Predicted Next-Period Expenditure", fontsize=8)
     ax.set_title("Predicted vs. Actual Expenditure", fontsize=9)
     ax.tick_params(axis="both", labelsize=6)
-    st.pyplot(fig, use_container_width=False)
+    show_figure(fig, use_container_width=False)
     st.markdown("### Predicted vs. Actual Next-Period Expenditure")
     st.markdown("""
     A scatterplot of **actual** vs. **predicted** next-period expenditure.  
@@ -114,8 +117,9 @@ def show_forecast():
     ts = cons_long.groupby("Year")["Expenditure"].mean().sort_index()
 
     # b) Fit Holt–Winters (additive trend)
-    hw = ExponentialSmoothing(ts, trend="add", seasonal=None)
-    fit = hw.fit()
+    with span("fit: food Holt-Winters"):
+        hw = ExponentialSmoothing(ts, trend="add", seasonal=None)
+        fit = hw.fit()
 
     # c) Forecast next 10 years
     steps = 10
@@ -127,7 +131,7 @@ def show_forecast():
     raw_forecast.index = future_years
 
     # e) Matplotlib plot with integer xticks
-    fig, ax = plt.subplots(figsize=(6, 3), dpi=120, constrained_layout=True)
+    fig, ax = subplots(figsize=(6, 3), dpi=120, constrained_layout=True)
     ax.plot(raw_forecast.index, raw_forecast.values, "-o", color="royalblue", label="Forecast")
     ax.set_title("🔮 10-Year Forecast of Average Expenditure", fontsize=12)
     ax.set_xlabel("Year", fontsize=10)
@@ -137,7 +141,7 @@ def show_forecast():
     ax.tick_params(axis="y", labelsize=8)
     ax.grid(alpha=0.3)
     ax.legend(fontsize=8, loc="upper left")
-    st.pyplot(fig, use_container_width=True)
+    show_figure(fig, use_container_width=True)
 
     # f) Show numeric values
     st.write(
@@ -1,10 +1,10 @@
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 
 from tabs.food_presentation.food_clean_data import load_and_clean          
 from tabs.food_presentation.food_clean_data_expenditure import load_and_clean_expenditure 
+from utils.figures import show_figure, subplots
 
 def show_price_expenditure_correlation():
     # 1) Load data
@@ -57,7 +57,7 @@ def show_price_expenditure_correlation():
     # Tab 0: Korrelations-barplot
     with tab0:
         st.subheader("📊 Correlation by Category")
-        fig, ax = plt.subplots(
+        fig, ax = subplots(
             figsize=(6, max(4, len(corr_df)*0.12)),
             dpi=120, constrained_layout=True
         )
@@ -72,7 +72,7 @@ def show_price_expenditure_correlation():
         for label in ax.get_yticklabels():
             label.set_fontsize(6)
      
-        st.pyplot(fig, use_container_width=False)
+        show_figure(fig, use_container_width=False)
 
         st.markdown("""
 **How to read this chart:**  
@@ -92,7 +92,7 @@ def show_price_expenditure_correlation():
         years = sub["Year"].tolist()
         x_pos  = list(range(len(years)))  
 
-        fig, ax = plt.subplots(figsize=(3, 2), dpi=120, constrained_layout=True)
+        fig, ax = subplots(figsize=(3, 2), dpi=120, constrained_layout=True)
 
         # Blå scatter: PriceChange over Year
         ax.scatter(
@@ -131,7 +131,7 @@ def show_price_expenditure_correlation():
         h2, l2 = ax2.get_legend_handles_labels()
         ax.legend(h1+h2, l1+l2, loc="upper left", fontsize=6)
 
-        st.pyplot(fig, use_container_width=False)
+        show_figure(fig, use_container_width=False)
 
         st.markdown("""
 **Explanation of the scatterplot:**  
@@ -150,7 +150,7 @@ def show_price_expenditure_correlation():
         dfp2 = dfp[dfp["Year"].isin(years)]
         dfe2 = dfe[dfe["Year"].isin(years)]
 
-        fig, ax1 = plt.subplots(figsize=(5,2.5), dpi=120, constrained_layout=True)
+        fig, ax1 = subplots(figsize=(5,2.5), dpi=120, constrained_layout=True)
         ax1.plot(years, dfp2["PriceChange"].tolist(), "-o", label="PriceChange (%)")
         ax1.set_xlabel("Year"); ax1.set_ylabel("PriceChange (%)"); ax1.grid(alpha=0.3)
         ax2 = ax1.twinx()
@@ -158,7 +158,7 @@ def show_price_expenditure_correlation():
         ax2.set_ylabel("Expenditure (DKK)")
         h1,l1 = ax1.get_legend_handles_labels(); h2,l2 = ax2.get_legend_handles_labels()
         ax1.legend(h1+h2, l1+l2, loc="upper center", fontsize=6)
-        st.pyplot(fig, use_container_width=False)
+        show_figure(fig, use_container_width=False)
 
         st.markdown("""
 **Explanation of the scatterplot:**  
@@ -205,7 +205,7 @@ If both series climbed together, it would suggest that demand was price-inelasti
         exp_vals   = [total_exp[y]   for y in common_years]
 
         # 4) Plot med delt x-akse
-        fig, ax1 = plt.subplots(figsize=(5, 2.5), dpi=150, constrained_layout=True)
+        fig, ax1 = subplots(figsize=(5, 2.5), dpi=150, constrained_layout=True)
         ax1.plot(common_years, price_vals, "-o", color="teal", label="Avg PriceChange (%)")
         ax1.axhline(0, color="gray", linestyle="--")
         ax1.set_ylabel("Avg PriceChange (%)")
@@ -222,4 +222,4 @@ If both series climbed together, it would suggest that demand was price-inelasti
         h2, l2 = ax2.get_legend_handles_labels()
         ax1.legend(h1 + h2, l1 + l2, loc="upper left", fontsize=6)
 
-        st.pyplot(fig, use_container_width=False)
+        show_figure(fig, use_container_width=False)
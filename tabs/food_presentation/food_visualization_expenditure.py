@@ -1,9 +1,8 @@
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
 import os
-from scipy.stats.mstats import winsorize
 from tabs.food_presentation.food_clean_data_expenditure import load_and_clean_expenditure
+from utils.figures import show_figure, subplots
 
 def show_visualization_expenditure():
 
@@ -25,7 +24,7 @@ def show_visualization_expenditure():
 
         # --- plot i lille format ---
         st.subheader(f"Avg Expenditure per Household: {sel}")
-        fig, ax = plt.subplots(
+        fig, ax = subplots(
             figsize=(4, 1.5),     # mindre figur
             dpi=120,
             constrained_layout=True
@@ -45,7 +44,7 @@ def show_visualization_expenditure():
         ax.tick_params(axis="y", labelsize=5)
         ax.grid(alpha=0.4, linewidth=0.5)
 
-        st.pyplot(fig, use_container_width=False)
+        show_figure(fig, use_container_width=False)
 
         st.markdown("""
     **Description:**  
@@ -62,7 +61,7 @@ def show_visualization_expenditure():
         total = df_long[df_long["Category"] == "01 FØDEVARER OG IKKE-ALKOHOLISKE DRIKKEVARER"]
 
         # Plot totalforbrug
-        fig_tot, ax_tot = plt.subplots(
+        fig_tot, ax_tot = subplots(
             figsize=(4, 1.5),
             dpi=120,
             constrained_layout=True
@@ -81,7 +80,7 @@ def show_visualization_expenditure():
         ax_tot.tick_params(axis="y", labelsize=5)
         ax_tot.grid(alpha=0.4, linewidth=0.5)
 
-        st.pyplot(fig_tot, use_container_width=False)
+        show_figure(fig_tot, use_container_width=False)
         st.markdown("""
     This chart shows the **average total annual expenditure on food per household** from 2014 to 2022.
     - We observe a **steady increase** year over year, reflecting rising food prices and consumption patterns.
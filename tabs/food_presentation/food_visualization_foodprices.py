@@ -1,12 +1,12 @@
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
 import os
-from sklearn.cluster import KMeans
-from scipy.stats.mstats import winsorize
 from tabs.food_presentation.food_clean_data import load_and_clean
+from utils.perf import span
+from utils.figures import show_figure, show_cached_figure, subplots
 
 def show_visualization():
+    from sklearn.cluster import KMeans
 
     raw_df, data, years = load_and_clean()
 
@@ -34,7 +34,7 @@ def show_visualization():
             values = pd.to_numeric(values, errors='coerce')
 
         # --- LINE GRAPH ---
-        fig, ax = plt.subplots(figsize=(5, 2.5), dpi=150, constrained_layout=True)
+        fig, ax = subplots(figsize=(5, 2.5), dpi=150, constrained_layout=True)
         ax.plot(values.index, values.values, marker='o', linestyle='-', color='royalblue')
 
         for i, v in enumerate(values):
@@ -53,7 +53,7 @@ def show_visualization():
         ax.tick_params(axis='y', labelsize=6)             # <-- smaller y-axis labels
         ax.grid(True, linewidth=0.5, alpha=0.7)
 
-        st.pyplot(fig,  use_container_width=False)
+        show_figure(fig, use_container_width=False)
 
         st.markdown("""
         📊 **Insight**:  
@@ -73,7 +73,7 @@ def show_visualization():
         st.subheader("📊 Average Annual Price Change per Category")
 
         # make it more compact
-        fig3, ax3 = plt.subplots(
+        fig3, ax3 = subplots(
             figsize=(6, 8),       # narrower and shorter
             dpi=120,
             constrained_layout=True
@@ -93,7 +93,7 @@ def show_visualization():
         ax3.tick_params(axis='y', labelsize=6)  # category names
         ax3.tick_params(axis='x', labelsize=6)  # numeric axis
 
-        st.pyplot(fig3, use_container_width=False)
+        show_figure(fig3, use_container_width=False)
 
 
         st.markdown("""
@@ -115,22 +115,24 @@ def show_visualization():
         years_labels = pd.Index(years, dtype=str)
 
 
-        # make this one smaller
-        fig0, ax0 = plt.subplots(figsize=(5, 2.5), dpi=150, constrained_layout=True)
-        ax0.plot(years_labels, yearly_avgs.values, marker='o', linestyle='-', color='teal')
+        def draw_overall_trend():
+            # make this one smaller
+            fig0, ax0 = subplots(figsize=(5, 2.5), dpi=150, constrained_layout=True)
+            ax0.plot(years_labels, yearly_avgs.values, marker='o', linestyle='-', color='teal')
 
-        ax0.axhline(0, color='gray', linestyle='--', linewidth=0.8)
-        ax0.set_title("Avg Annual % Change (all categories)", fontsize=8, pad=6)
-        ax0.set_xlabel("Year", fontsize=7)
-        ax0.set_ylabel("Avg Change (%)", fontsize=7)
+            ax0.axhline(0, color='gray', linestyle='--', linewidth=0.8)
+            ax0.set_title("Avg Annual % Change (all categories)", fontsize=8, pad=6)
+            ax0.set_xlabel("Year", fontsize=7)
+            ax0.set_ylabel("Avg Change (%)", fontsize=7)
 
-        # shrink tick labels
-        ax0.tick_params(axis='x', labelsize=6, rotation=0)
-        ax0.tick_params(axis='y', labelsize=6)
+            # shrink tick labels
+            ax0.tick_params(axis='x', labelsize=6, rotation=0)
+            ax0.tick_params(axis='y', labelsize=6)
 
-        ax0.grid(alpha=0.3, linewidth=0.5)
+            ax0.grid(alpha=0.3, linewidth=0.5)
+            return fig0
 
-        st.pyplot(fig0, use_container_width=False)
+        show_cached_figure("food overall trend", [yearly_avgs, list(years_labels)], draw_overall_trend, use_container_width=False)
 
         st.markdown("""
         This chart shows the **average** annual price change across all food categories:
@@ -147,15 +149,19 @@ def show_visualization():
         st.subheader("⚡ Volatility: Std Dev of Annual Price Changes")
 
         vol = data[years].std(axis=0, skipna=True)
-        fig_v, ax_v = plt.subplots(figsize=(4, 2), dpi=120, constrained_layout=True)
-        ax_v.plot(years_labels, vol.values, marker='X', linestyle='-', color='seagreen')
-        ax_v.set_title("Volatility of Food Price Changes", fontsize=8, pad=6)
-        ax_v.set_xlabel("Year", fontsize=7)
-        ax_v.set_ylabel("Std Dev (%)", fontsize=7)
-        ax_v.tick_params(axis='x', labelsize=6, rotation=0)
-        ax_v.tick_params(axis='y', labelsize=6)
-        ax_v.grid(alpha=0.3)
-        st.pyplot(fig_v, use_container_width=False)
+
+        def draw_volatility():
+            fig_v, ax_v = subplots(figsize=(4, 2), dpi=120, constrained_layout=True)
+            ax_v.plot(years_labels, vol.values, marker='X', linestyle='-', color='seagreen')
+            ax_v.set_title("Volatility of Food Price Changes", fontsize=8, pad=6)
+            ax_v.set_xlabel("Year", fontsize=7)
+            ax_v.set_ylabel("Std Dev (%)", fontsize=7)
+            ax_v.tick_params(axis='x', labelsize=6, rotation=0)
+            ax_v.tick_params(axis='y', labelsize=6)
+            ax_v.grid(alpha=0.3)
+            return fig_v
+
+        show_cached_figure("food volatility", [vol, list(years_labels)], draw_volatility, use_container_width=False)
 
         st.markdown("""
         This chart shows the **yearly standard deviation** of price changes across all food categories:
@@ -168,11 +174,12 @@ def show_visualization():
         stats.columns = ['MeanChange','Volatility']
 
         # 2) K-Means med 2 klynger
-        kmeans = KMeans(n_clusters=2, random_state=0).fit(stats)
+        with span("fit: food KMeans"):
+            kmeans = KMeans(n_clusters=2, random_state=0).fit(stats)
         stats['Cluster'] = kmeans.labels_.astype(str)
 
         # 3) Plot
-        fig_c, ax_c = plt.subplots(figsize=(4,3), dpi=120, constrained_layout=True)
+        fig_c, ax_c = subplots(figsize=(4,3), dpi=120, constrained_layout=True)
         for cluster, grp in stats.groupby('Cluster'):
             ax_c.scatter(grp['MeanChange'], grp['Volatility'], label=f"Cluster {cluster}", s=20)
         ax_c.set_xlabel("Avg Annual Change (%)", fontsize=7)
@@ -180,7 +187,7 @@ def show_visualization():
         ax_c.set_title("Cluster: Stable vs. Volatile Categories", fontsize=8)
         ax_c.legend(fontsize=6)
         ax_c.grid(alpha=0.3)
-        st.pyplot(fig_c, use_container_width=False)
+        show_figure(fig_c, use_container_width=False)
 
         st.markdown("""
     **Cluster explanation:**  
@@ -196,7 +203,7 @@ def show_visualization():
             "01.1.7.1 Grøntsager ekskl. kartofler, frisk"
         ]
 
-        fig_s, ax_s = plt.subplots(
+        fig_s, ax_s = subplots(
         figsize=(4, 2),        # small width×height
         dpi=150,               # højere densitet
         constrained_layout=True
@@ -222,7 +229,7 @@ def show_visualization():
         ax_s.legend(fontsize=5, loc="upper left")
         ax_s.grid(alpha=0.3, linewidth=0.4)
 
-        st.pyplot(fig_s, use_container_width=False)
+        show_figure(fig_s, use_container_width=False)
 
 
         st.markdown("""
@@ -1,21 +1,21 @@
 import streamlit as st
-import seaborn as sns
-import matplotlib.pyplot as plt
 from tabs.rent_presentations.rent_data import loadRentData
+from utils.figures import show_figure, subplots
 
 def show_boxplot(df):
+    import seaborn as sns
     st.header("Boxplot – Huslejeindeks per kvartal (2021–2024)")
 
     df_t = df.T  # kvartaler som index
     df_melted = df_t.reset_index().melt(id_vars="index", var_name="Region", value_name="Indeks")
     df_melted.rename(columns={"index": "Kvartal"}, inplace=True)
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    sns.boxplot(x="Kvartal", y="Indeks", data=df_melted, palette="pastel")
-    plt.xticks(rotation=45)
+    fig, ax = subplots(figsize=(12, 6))
+    sns.boxplot(x="Kvartal", y="Indeks", data=df_melted, palette="pastel", ax=ax)
+    ax.tick_params(axis="x", rotation=45)
     
     ax.set_title("Fordeling af huslejeindeks per kvartal")
-    st.pyplot(fig)
+    show_figure(fig)
 
 
 
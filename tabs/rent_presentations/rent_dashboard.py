@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import seaborn as sns
 import matplotlib.pyplot as plt
 
 from tabs.rent_presentations.rent_data import loadRentData, plotRentData
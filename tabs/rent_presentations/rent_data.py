@@ -1,12 +1,17 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
+from utils.excel_cache import read_excel
+from utils.memo_cache import memoize
+from utils.perf import timed
+from utils.figures import show_figure, subplots
 
 
+@timed("load: rent data")
+@memoize(files=lambda filepath: [filepath])
 def loadRentData(filepath):
     try:
       
-        df = pd.read_excel(filepath, skiprows=2)
+        df = read_excel(filepath, skiprows=2)
 
         df = df.drop(columns=[df.columns[0], df.columns[1]])
 
@@ -29,15 +34,15 @@ def loadRentData(filepath):
 
     
 def plotRentData(df):
-    fig, ax = plt.subplots()
+    fig, ax = subplots()
     df.T.plot(marker='o', ax=ax)
     ax.set_title("Udvikling i huslejeindeks 2021 - 2024")
     ax.set_xlabel("Kvartal")
     ax.set_ylabel("Indeks (2021 = 100)")
     ax.legend(title="Region")
     ax.grid(True)
-    plt.tight_layout()
-    st.pyplot(fig)
+    fig.tight_layout()
+    show_figure(fig)
 
 def main():
     st.title("Huslejeindeks i Danmark – 2024 (Almene boliger)")
@@ -1,9 +1,9 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.linear_model import LinearRegression
+from utils.perf import span
+from utils.figures import show_figure, subplots
+from utils.poly_trend import fit_trend, predict_trend
 
 
 def forecast_rent(df):
@@ -19,27 +19,24 @@ def forecast_rent(df):
     X = df_T["Kvartal_nr"].values.reshape(-1, 1)
 
     #polynomiel regression (grad 3 for kurve)
-    poly = PolynomialFeatures(degree=3)
-    X_poly = poly.fit_transform(X)
-    model = LinearRegression()
-    model.fit(X_poly, y)
+    with span("fit: rent polynomial"):
+        trend = fit_trend(X.ravel(), y, 3)
 
     # Forudsig fremtidige kvartaler
     future_X = np.array(range(len(X) + 1, len(X) + future_quarters + 1)).reshape(-1, 1)
-    future_X_poly = poly.transform(future_X)
-    forecasted = model.predict(future_X_poly)
+    forecasted = predict_trend(trend, future_X.ravel(), 3)
 
     full_X = np.concatenate([X, future_X])
     full_y = np.concatenate([y, forecasted])
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = subplots(figsize=(10, 5))
     ax.plot(full_X, full_y, marker="o", label="Actual + Forecast")
     ax.axvline(len(X), color="red", linestyle="--", label="Forecast starts here")
     ax.set_xlabel("Quarter Number")
     ax.set_ylabel("Rent Index")
     ax.set_title(f"Forecast of Rent Index – {region}")
     ax.legend()
-    st.pyplot(fig)
+    show_figure(fig)
 
     last_q = df_T["Kvartal"].iloc[-1]
     last_year = int(last_q[:4])
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from tabs.rent_presentations.rent_data import loadRentData
+from utils.figures import show_figure, subplots
 
 def calculate_growth(df):
     df_growth = df.copy()
@@ -15,14 +15,14 @@ def show_growth(df):
     growth_df = calculate_growth(df)
 
     st.subheader("Vækstkurve per region")
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = subplots(figsize=(12, 6))
     growth_df.T.plot(ax=ax, marker='o')
     ax.set_title("Kvartal-vækst i huslejeindeks")
     ax.set_xlabel("Kvartal")
     ax.set_ylabel("Vækst (%)")
     ax.axhline(0, color='gray', linestyle='--')
     ax.legend(title="Region")
-    st.pyplot(fig)
+    show_figure(fig)
 
     if st.checkbox("Vis vækstrate tabel"):
         st.dataframe(growth_df.round(2))
@@ -1,11 +1,11 @@
 import pandas as pd
 import streamlit as st
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 from tabs.rent_presentations.rent_data import loadRentData, plotRentData
+from utils.figures import show_cached_figure, subplots
 
 def show_correlation_heatmap(df):
+    import seaborn as sns
     st.header("Korrelationsanalyse af huslejeindeks 2021 - 2024")
     st.write("Nedenfor ses et heatmap over korrelationerne mellem kvartalerne i 2024.")
 
@@ -16,9 +16,12 @@ def show_correlation_heatmap(df):
     corr = numeric_df.T.corr()
 
 
-    fig, ax = plt.subplots(figsize=(8, 6))
-    sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f", ax=ax)
-    st.pyplot(fig)
+    def draw():
+        fig, ax = subplots(figsize=(8, 6))
+        sns.heatmap(corr, annot=True, cmap="coolwarm", fmt=".2f", ax=ax)
+        return fig
+
+    show_cached_figure("rent correlation heatmap", [corr], draw)
 
     st.subheader("Forklaring:")
     st.markdown("""
@@ -1,5 +1,5 @@
 import streamlit as st
-import pandas as pd
+from utils.excel_cache import read_excel
 
 def show_salary_data_preparation():
     st.subheader("Data Preparation for Salary Data")
@@ -82,7 +82,7 @@ def show_salary_data_preparation():
 
     # RAW 2013
     st.markdown("**📄 Raw data – 2013 (first 15 rows):**")
-    raw_2013 = pd.read_excel("Data/Salary/Stats all 13 - 23 salary/all 2013.xlsx", sheet_name="LONS30", header=None)
+    raw_2013 = read_excel("Data/Salary/Stats all 13 - 23 salary/all 2013.xlsx", sheet_name="LONS30", header=None)
     st.dataframe(raw_2013.head(15), use_container_width=True)
 
     # CLEANED 2013
@@ -93,7 +93,7 @@ def show_salary_data_preparation():
 
     # RAW 2023
     st.markdown("**📄 Raw data – 2023 (first 15 rows):**")
-    raw_2023 = pd.read_excel("Data/Salary/Stats all 13 - 23 salary/all 2023.xlsx", sheet_name="LONS30", header=None)
+    raw_2023 = read_excel("Data/Salary/Stats all 13 - 23 salary/all 2023.xlsx", sheet_name="LONS30", header=None)
     st.dataframe(raw_2023.head(15), use_container_width=True)
 
     # CLEANED 2023
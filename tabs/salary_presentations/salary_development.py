@@ -1,11 +1,10 @@
 import os
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from utils.salary_loader import load_salary_data
+from utils.salary_loader import load_salary_data, load_salary_series
+from utils.figures import show_figure, subplots
 
 def show_salary_development():
+    import seaborn as sns
     st.subheader("Salary by sector and group")
 
     st.markdown("""
@@ -81,16 +80,10 @@ def show_salary_development():
     st.markdown("---")
     st.markdown("### Salary development from 2013 to 2023")
 
-    trend_data = []
+    trend, trend_error = load_salary_series(group, wage_category, available_years)
 
-    for y in available_years:
-        df_year, err = load_salary_data(group, y, wage_category)
-        if df_year is not None:
-            avg_salary = df_year["Timefortjeneste (kr)"].mean()
-            trend_data.append({"År": y, "Gennemsnitlig løn (kr)": avg_salary})
-
-    if trend_data:
-        df_trend = pd.DataFrame(trend_data).sort_values("År")
+    if trend is not None:
+        df_trend = trend.rename("Gennemsnitlig løn (kr)").reset_index().sort_values("År")
         df_trend["År"] = df_trend["År"].astype(str)
 
         # Beregn procentvis ændring
@@ -106,14 +99,14 @@ def show_salary_development():
         st.bar_chart(df_trend.set_index("År")[["Gennemsnitlig løn (kr)"]])
 
         # Punktdiagram – procentvis ændring
-        fig, ax = plt.subplots(figsize=(4, 2))
+        fig, ax = subplots(figsize=(4, 2))
         sns.scatterplot(data=df_trend, x="År", y="Procentvis ændring (%)", s=60, color='blue', ax=ax)
         ax.set_title("Procentvis lønudvikling fra år til år", fontsize=10)
         ax.set_ylabel("Ændring i %", fontsize=9)    
         ax.set_xlabel("År", fontsize=9)
         ax.tick_params(axis='both', labelsize=8)
         ax.grid(True)
-        st.pyplot(fig)
+        show_figure(fig)
 
         # ✅ Tilføj samlet lønudvikling over hele perioden
         løn_start = df_trend["Gennemsnitlig løn (kr)"].iloc[0]
@@ -1,15 +1,16 @@
 import os
 import streamlit as st
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
-from adjustText import adjust_text
 from utils.salary_loader import load_salary_data
+from utils.perf import span
+from utils.figures import show_figure, subplots
 
 def show_salary_statistics():
+    import seaborn as sns
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import silhouette_score
+    from adjustText import adjust_text
     st.subheader("Gender-Based Sector Analysis")
 
     folder_base = "Data/Salary/Stats All men 13 - 23 salary"
@@ -42,7 +43,7 @@ def show_salary_statistics():
     })
 
     st.markdown("### ⚖️ Gender Pay Gap by Sector")
-    fig1, ax1 = plt.subplots()
+    fig1, ax1 = subplots()
     sns.scatterplot(
         data=df_merged,
         x="Women - Hourly Wage (DKK)",
@@ -57,7 +58,7 @@ def show_salary_statistics():
     ax1.set_xlabel("Women – Hourly Wage (DKK)")
     ax1.set_ylabel("Men – Hourly Wage (DKK)")
     ax1.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-    st.pyplot(fig1)
+    show_figure(fig1)
 
     with st.expander("📌 What does the scatterplot show?"):
         st.markdown("""
@@ -68,13 +69,14 @@ def show_salary_statistics():
     st.markdown("### 🔍 Clustering of Sectors")
     features = df_merged[["Men - Hourly Wage (DKK)", "Women - Hourly Wage (DKK)"]]
     if len(features) > 2:
-        kmeans = KMeans(n_clusters=2, random_state=42).fit(features)
+        with span("fit: salary KMeans"):
+            kmeans = KMeans(n_clusters=2, random_state=42).fit(features)
         df_merged["Cluster"] = kmeans.labels_
         centers = kmeans.cluster_centers_
         score = silhouette_score(features, kmeans.labels_)
         st.info(f"Silhouette Score for Clustering: **{score:.2f}**")
 
-        fig2, ax2 = plt.subplots()
+        fig2, ax2 = subplots()
         sns.scatterplot(
             data=df_merged,
             x="Men - Hourly Wage (DKK)",
@@ -94,7 +96,7 @@ def show_salary_statistics():
         ax2.set_xlabel("Men – Hourly Wage (DKK)")
         ax2.set_ylabel("Women – Hourly Wage (DKK)")
         ax2.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        st.pyplot(fig2)
+        show_figure(fig2)
 
         with st.expander("📈 What does the clustering plot show?"):
             st.markdown("""
@@ -120,13 +122,13 @@ def show_salary_statistics():
             })
     df_box = pd.DataFrame(synthetic_data)
 
-    fig3, ax3 = plt.subplots(figsize=(10, 6))
+    fig3, ax3 = subplots(figsize=(10, 6))
     sns.boxplot(data=df_box, x="Sector", y="Wage", hue="Gender", ax=ax3)
     ax3.set_title("Boxplot of Hourly Wages by Gender and Sector")
     ax3.set_ylabel("Wage (DKK)")
     ax3.set_xlabel("Sector")
-    plt.xticks(rotation=45)
-    st.pyplot(fig3)
+    ax3.tick_params(axis="x", rotation=45)
+    show_figure(fig3)
 
     with st.expander("📌 What does the boxplot show?"):
         st.markdown("""
@@ -136,14 +138,14 @@ def show_salary_statistics():
 
     st.markdown("### 📉 Women's Wages as % of Men's by Sector")
     df_merged["Women as % of Men"] = (df_merged["Women - Hourly Wage (DKK)"] / df_merged["Men - Hourly Wage (DKK)"]) * 100
-    fig4, ax4 = plt.subplots()
+    fig4, ax4 = subplots()
     sns.barplot(data=df_merged, x="Sektor", y="Women as % of Men", palette="coolwarm", ax=ax4)
     ax4.axhline(100, linestyle='--', color='black')
     ax4.set_title("Women's Wages as % of Men's by Sector")
     ax4.set_ylabel("Percentage (%)")
     ax4.set_xlabel("Sector")
-    plt.xticks(rotation=45)
-    st.pyplot(fig4)
+    ax4.tick_params(axis="x", rotation=45)
+    show_figure(fig4)
 
     with st.expander("📌 What does the percentage plot show?"):
         st.markdown("""
@@ -168,12 +170,12 @@ def show_salary_statistics():
     sectors = ["Kommuner", "Regioner", "Sektorer i alt", "Stat", "Virksomheder"]
     heatmap_df = pd.DataFrame(heatmap_data, index=sectors)
 
-    fig5, ax5 = plt.subplots(figsize=(12, 6))
+    fig5, ax5 = subplots(figsize=(12, 6))
     sns.heatmap(heatmap_df, annot=True, fmt="d", cmap="coolwarm", ax=ax5)
     ax5.set_title("Wage Difference Between Men and Women by Sector Over Time")
     ax5.set_xlabel("Year")
     ax5.set_ylabel("Sector")
-    st.pyplot(fig5)
+    show_figure(fig5)
 
     with st.expander("📌 What does the heatmap show?"):
         st.markdown("""
@@ -0,0 +1,57 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# Hvor længe et svar genbruges, og hvor mange svar der højst gemmes
+TTL_SECONDS = float(os.environ.get("ANSWER_CACHE_TTL", 3600))
+MAX_ENTRIES = int(os.environ.get("ANSWER_CACHE_MAX_ENTRIES", 500))
+
+_entries = OrderedDict()  # key -> (svar, udløbstidspunkt)
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+
+# ----------------------------------
+# Delt cache af chatbot-svar på tværs af sessioner (LRU med TTL)
+# ----------------------------------
+def lookup(key):
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[1] <= now:
+            del _entries[key]
+            _stats["expired"] += 1
+            entry = None
+        if entry is None:
+            _stats["misses"] += 1
+            return None
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return entry[0]
+
+
+def store(key, answer):
+    if MAX_ENTRIES <= 0 or TTL_SECONDS <= 0:
+        return
+    with _lock:
+        _entries.pop(key, None)
+        _entries[key] = (answer, time.monotonic() + TTL_SECONDS)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def answer_cache_stats():
+    with _lock:
+        stats = dict(_stats, entries=len(_entries))
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+    return stats
+
+
+def clear_answers():
+    with _lock:
+        _entries.clear()
+        for name in _stats:
+            _stats[name] = 0
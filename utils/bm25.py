@@ -0,0 +1,57 @@
+import re
+import math
+
+# Standardværdier fra Okapi BM25
+K1 = 1.5
+B = 0.75
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    return _TOKEN.findall(str(text).lower())
+
+
+# ----------------------------------
+# Invers index over korte tekststykker (fakta)
+# ----------------------------------
+def build_bm25_index(documents):
+    postings = {}
+    lengths = []
+    for doc_id, text in enumerate(documents):
+        tokens = tokenize(text)
+        lengths.append(len(tokens))
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            postings.setdefault(token, []).append((doc_id, tf))
+
+    n_docs = len(documents)
+    # BM25+-lignende idf, der aldrig bliver negativ for meget hyppige ord
+    idf = {
+        token: math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+        for token, docs in postings.items()
+    }
+    return {
+        "postings": postings,
+        "idf": idf,
+        "lengths": lengths,
+        "avg_length": (sum(lengths) / n_docs) if n_docs else 0.0,
+    }
+
+
+def search(index, query, k=8):
+    scores = {}
+    avg_length = index["avg_length"] or 1.0
+    for token in set(tokenize(query)):
+        docs = index["postings"].get(token)
+        if not docs:
+            continue
+        idf = index["idf"][token]
+        for doc_id, tf in docs:
+            norm = K1 * (1 - B + B * index["lengths"][doc_id] / avg_length)
+            scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+    ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+    return ranked[:k]
@@ -0,0 +1,228 @@
+import os
+import json
+import hashlib
+from datetime import datetime
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+# Parquet kræver pyarrow – uden den læser vi Excel direkte som før
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+CACHE_DIR = os.environ.get("DATA_CACHE_DIR", ".cache/excel")
+
+# Celletyper i den kolonneformede cache
+KIND_INT, KIND_FLOAT, KIND_STR, KIND_BOOL, KIND_DATETIME, KIND_NAN = range(6)
+
+
+# ----------------------------------
+# Fingerprint af kildefilen
+# ----------------------------------
+def file_fingerprint(file_path):
+    stat = os.stat(file_path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def file_hash(file_path):
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _cache_paths(file_path):
+    key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    base = os.path.join(CACHE_DIR, f"{stem}-{key}")
+    return base + ".json", base + ".parquet"
+
+
+# ----------------------------------
+# Læs alle ark som rå celler (samme konvertering som pandas' openpyxl-reader)
+# ----------------------------------
+def _convert_cell(cell):
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    if cell.value is None:
+        return ""
+    elif cell.data_type == TYPE_ERROR:
+        return float("nan")
+    elif cell.data_type == TYPE_NUMERIC:
+        val = int(cell.value)
+        if val == cell.value:
+            return val
+        return float(cell.value)
+    return cell.value
+
+
+def _read_workbook_cells(file_path):
+    from openpyxl import load_workbook
+
+    book = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    sheets = {}
+    try:
+        for sheet in book.worksheets:
+            sheet.reset_dimensions()
+            data = []
+            last_row_with_data = -1
+            for row_number, row in enumerate(sheet.rows):
+                converted_row = [_convert_cell(cell) for cell in row]
+                while converted_row and converted_row[-1] == "":
+                    converted_row.pop()
+                if converted_row:
+                    last_row_with_data = row_number
+                data.append(converted_row)
+            data = data[: last_row_with_data + 1]
+
+            if data:
+                max_width = max(len(r) for r in data)
+                data = [r + [""] * (max_width - len(r)) for r in data]
+            sheets[sheet.title] = data
+    finally:
+        book.close()
+    return sheets
+
+
+# ----------------------------------
+# Celler <-> lang kolonnetabel (sheet, row, col, kind, num, text)
+# ----------------------------------
+def _cells_to_table(sheets):
+    cols = {"sheet": [], "row": [], "col": [], "kind": [], "num": [], "text": []}
+    for sheet_name, data in sheets.items():
+        for r, row in enumerate(data):
+            for c, value in enumerate(row):
+                if isinstance(value, str) and value == "":
+                    continue
+                if isinstance(value, bool):
+                    kind, num, text = KIND_BOOL, float(value), None
+                elif isinstance(value, int):
+                    kind, num, text = KIND_INT, float(value), str(value)
+                elif isinstance(value, float):
+                    kind = KIND_NAN if value != value else KIND_FLOAT
+                    num, text = value, None
+                elif isinstance(value, datetime):
+                    kind, num, text = KIND_DATETIME, None, value.isoformat()
+                else:
+                    kind, num, text = KIND_STR, None, str(value)
+                cols["sheet"].append(sheet_name)
+                cols["row"].append(r)
+                cols["col"].append(c)
+                cols["kind"].append(kind)
+                cols["num"].append(num)
+                cols["text"].append(text)
+
+    schema = pa.schema([
+        ("sheet", pa.string()),
+        ("row", pa.int32()),
+        ("col", pa.int32()),
+        ("kind", pa.int8()),
+        ("num", pa.float64()),
+        ("text", pa.string()),
+    ])
+    return pa.table(cols, schema=schema)
+
+
+def _table_to_cells(table, shapes):
+    sheets = {name: [[""] * n_cols for _ in range(n_rows)] for name, (n_rows, n_cols) in shapes}
+    columns = table.to_pydict()
+    for sheet_name, r, c, kind, num, text in zip(
+        columns["sheet"], columns["row"], columns["col"],
+        columns["kind"], columns["num"], columns["text"]
+    ):
+        if kind == KIND_INT:
+            value = int(text)
+        elif kind == KIND_FLOAT or kind == KIND_NAN:
+            value = float("nan") if num is None else num
+        elif kind == KIND_BOOL:
+            value = bool(num)
+        elif kind == KIND_DATETIME:
+            value = datetime.fromisoformat(text)
+        else:
+            value = text
+        sheets[sheet_name][r][c] = value
+    return sheets
+
+
+# ----------------------------------
+# Hent (eller byg) cachen for én projektmappe
+# ----------------------------------
+def _load_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest_path, manifest):
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def load_workbook_cells(file_path):
+    manifest_path, parquet_path = _cache_paths(file_path)
+    fingerprint = file_fingerprint(file_path)
+    manifest = _load_manifest(manifest_path)
+
+    if manifest is not None and os.path.exists(parquet_path):
+        fresh = (manifest["mtime_ns"], manifest["size"]) == (fingerprint["mtime_ns"], fingerprint["size"])
+        # mtime ændret (fx ved checkout) – indholdet kan stadig være det samme
+        if not fresh and manifest["size"] == fingerprint["size"] and manifest["sha256"] == file_hash(file_path):
+            manifest.update(fingerprint)
+            _write_manifest(manifest_path, manifest)
+            fresh = True
+        if fresh:
+            try:
+                table = pq.read_table(parquet_path)
+                return _table_to_cells(table, manifest["sheets"])
+            except Exception:
+                pass  # beskadiget cache – byg forfra
+
+    sheets = _read_workbook_cells(file_path)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = parquet_path + ".tmp"
+    pq.write_table(_cells_to_table(sheets), tmp_path)
+    os.replace(tmp_path, parquet_path)
+    _write_manifest(manifest_path, {
+        "source": os.path.abspath(file_path),
+        "sha256": file_hash(file_path),
+        "sheets": [[name, [len(data), len(data[0]) if data else 0]] for name, data in sheets.items()],
+        **fingerprint,
+    })
+    return sheets
+
+
+# ----------------------------------
+# Drop-in for pd.read_excel (header, skiprows, nrows, sheet_name)
+# ----------------------------------
+def read_excel(file_path, sheet_name=0, header=0, skiprows=None, nrows=None):
+    if pq is None:
+        return pd.read_excel(file_path, sheet_name=sheet_name, header=header, skiprows=skiprows, nrows=nrows)
+
+    sheets = load_workbook_cells(file_path)
+    if isinstance(sheet_name, int):
+        sheet_name = list(sheets)[sheet_name]
+    elif sheet_name not in sheets:
+        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+    data = [list(row) for row in sheets[sheet_name]]
+    if not data:
+        return pd.DataFrame()
+
+    parser = TextParser(
+        data,
+        header=header,
+        skiprows=skiprows,
+        nrows=nrows,
+        skip_blank_lines=False,
+    )
+    return parser.read(nrows=nrows)
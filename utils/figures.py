@@ -0,0 +1,59 @@
+import io
+
+import matplotlib.pyplot as plt
+import streamlit as st
+from matplotlib.figure import Figure
+from utils.memo_cache import remember, data_fingerprint
+from utils.perf import span
+
+# Samme indstillinger som st.pyplot bruger, så cachede billeder ser ens ud
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200, "format": "png"}
+
+_SUBPLOTS_KEYS = ("sharex", "sharey", "squeeze", "width_ratios", "height_ratios", "subplot_kw", "gridspec_kw")
+
+
+# ----------------------------------
+# Figurer uden for pyplots globale register
+# ----------------------------------
+def subplots(nrows=1, ncols=1, **kwargs):
+    # Samme kald som plt.subplots, men figuren registreres ikke i pyplot,
+    # så den frigives af garbage collectoren, når den ikke bruges mere
+    subplot_args = {k: kwargs.pop(k) for k in _SUBPLOTS_KEYS if k in kwargs}
+    fig = Figure(**kwargs)
+    return fig, fig.subplots(nrows, ncols, **subplot_args)
+
+
+# ----------------------------------
+# Vis en figur i Streamlit og luk den bagefter
+# ----------------------------------
+def show_figure(fig, **kwargs):
+    try:
+        with span("render: pyplot"):
+            st.pyplot(fig, **kwargs)
+    finally:
+        plt.close(fig)
+
+
+# ----------------------------------
+# Cache af færdigrenderede figurer (PNG), nøglet på data og parametre.
+# draw() kaldes kun ved cache-miss og skal returnere figuren.
+# ----------------------------------
+def render_png(fig):
+    image = io.BytesIO()
+    fig.savefig(image, **SAVEFIG_OPTIONS)
+    return image.getvalue()
+
+
+def _draw_and_render(name, draw):
+    with span(f"render: {name}"):
+        fig = draw()
+        try:
+            return render_png(fig)
+        finally:
+            plt.close(fig)
+
+
+def show_cached_figure(name, inputs, draw, use_container_width=True):
+    key = data_fingerprint(*inputs)
+    png = remember(f"figure: {name}", key, lambda: _draw_and_render(name, draw), copy=False)
+    st.image(png, width="stretch" if use_container_width else "content")
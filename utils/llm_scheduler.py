@@ -0,0 +1,148 @@
+import os
+import time
+import threading
+from collections import deque
+
+# Hvor mange generationer sprogmodellen må køre på samme tid (CPU-modellen klarer sjældent mere end én)
+MAX_CONCURRENT = max(1, int(os.environ.get("LLM_MAX_CONCURRENT", 1)))
+
+# Hvor ofte ventende sessioner får opdateret deres plads i køen (sekunder)
+POLL_SECONDS = 0.25
+
+_cond = threading.Condition()
+_queue = deque()      # flights der venter på en plads, i ankomstrækkefølge
+_flights = {}         # nøgle -> flight der venter eller kører
+_running = 0
+_waits = deque(maxlen=500)
+_stats = {"submitted": 0, "shared": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+
+class _Flight:
+    # Én generation; alle sessioner med samme nøgle læser de samme bidder
+    def __init__(self, key, generate):
+        self.key = key
+        self.generate = generate
+        self.chunks = []
+        self.started = False
+        self.done = False
+        self.error = None
+        self.subscribers = 0
+        self.cancel = threading.Event()
+        self.queued_at = time.monotonic()
+
+
+# ----------------------------------
+# Fælles kø med loft over samtidige kald og deling af identiske kald
+# ----------------------------------
+def submit(key, generate):
+    # generate(cancel_event) skal returnere en iterator af tekstbidder
+    with _cond:
+        _stats["submitted"] += 1
+        flight = _flights.get(key)
+        if flight is not None and not flight.cancel.is_set():
+            _stats["shared"] += 1
+        else:
+            flight = _Flight(key, generate)
+            _flights[key] = flight
+            _queue.append(flight)
+            threading.Thread(target=_run, args=(flight,), name="llm-flight", daemon=True).start()
+        flight.subscribers += 1
+        return flight
+
+
+def _run(flight):
+    global _running
+
+    with _cond:
+        while _queue[0] is not flight or _running >= MAX_CONCURRENT:
+            if flight.cancel.is_set():
+                # Ingen venter længere på svaret – forlad køen uden at kalde modellen
+                _queue.remove(flight)
+                flight.done = True
+                _stats["cancelled"] += 1
+                _cond.notify_all()
+                return
+            _cond.wait()
+        _queue.popleft()
+        _running += 1
+        flight.started = True
+        _waits.append(time.monotonic() - flight.queued_at)
+        _cond.notify_all()
+
+    try:
+        if not flight.cancel.is_set():
+            for chunk in flight.generate(flight.cancel):
+                if flight.cancel.is_set():
+                    break
+                with _cond:
+                    flight.chunks.append(chunk)
+                    _cond.notify_all()
+    except Exception as e:
+        flight.error = e
+    finally:
+        with _cond:
+            _running -= 1
+            flight.done = True
+            if _flights.get(flight.key) is flight:
+                del _flights[flight.key]
+            if flight.error is not None:
+                _stats["failed"] += 1
+            elif flight.cancel.is_set():
+                _stats["cancelled"] += 1
+            else:
+                _stats["completed"] += 1
+            _cond.notify_all()
+
+
+def queue_position(flight):
+    # 1 = næste i køen, 0 = kører eller færdig
+    with _cond:
+        try:
+            return _queue.index(flight) + 1
+        except ValueError:
+            return 0
+
+
+def stream(flight, cancel_event=None, on_queue=None):
+    # Giver generationens bidder efterhånden som de kommer. on_queue(plads) kaldes
+    # mens der ventes; når sidste abonnent stopper, afbrydes generationen.
+    sent = 0
+    waiting = True
+    try:
+        while True:
+            with _cond:
+                if not (flight.done or len(flight.chunks) > sent):
+                    _cond.wait(POLL_SECONDS)
+                chunks = flight.chunks[sent:]
+                done, started = flight.done, flight.started
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            if on_queue is not None and waiting:
+                on_queue(0 if started or done else queue_position(flight))
+                waiting = not (started or done)
+            for chunk in chunks:
+                sent += 1
+                yield chunk
+            if done and sent == len(flight.chunks):
+                break
+        if flight.error is not None:
+            raise flight.error
+    finally:
+        with _cond:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                flight.cancel.set()
+                # En annulleret flight i køen må ikke genbruges af nye spørgsmål
+                if _flights.get(flight.key) is flight:
+                    del _flights[flight.key]
+                _cond.notify_all()
+
+
+def scheduler_stats():
+    with _cond:
+        waits = sorted(_waits)
+        stats = dict(_stats, running=_running, queued=len(_queue), max_concurrent=MAX_CONCURRENT)
+    stats["avg_wait_s"] = sum(waits) / len(waits) if waits else 0.0
+    stats["p95_wait_s"] = waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+    stats["max_wait_s"] = waits[-1] if waits else 0.0
+    return stats
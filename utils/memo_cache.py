@@ -0,0 +1,188 @@
+import os
+import sys
+import hashlib
+import inspect
+import functools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Samlet loft for alle memoiserede resultater i processen
+MAX_BYTES = int(float(os.environ.get("MEMO_CACHE_MAX_MB", 256)) * 1024 * 1024)
+
+_entries = OrderedDict()  # key -> (value, size)
+_lock = threading.RLock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0, "functions": {}}
+# Træf/miss også pr. tråd – hver Streamlit-session kører sit rerun i sin egen tråd
+_thread = threading.local()
+
+
+# ----------------------------------
+# Størrelse og kopiering af resultater
+# ----------------------------------
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+def _copy_result(value):
+    # Kaldere ændrer ofte de returnerede DataFrames – cachen skal forblive uberørt
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=True)
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, list):
+        return [_copy_result(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _copy_result(v) for k, v in value.items()}
+    return value
+
+
+def _file_state(path):
+    try:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (os.path.abspath(path), None, None)
+
+
+# ----------------------------------
+# Opslag, indsættelse og LRU-udsmidning
+# ----------------------------------
+def _get(key):
+    with _lock:
+        if key in _entries:
+            _entries.move_to_end(key)
+            return True, _entries[key][0]
+        return False, None
+
+
+def _put(key, value):
+    size = estimate_size(value)
+    if size > MAX_BYTES:
+        return
+    with _lock:
+        if key in _entries:
+            _stats["bytes"] -= _entries.pop(key)[1]
+        _entries[key] = (value, size)
+        _stats["bytes"] += size
+        while _stats["bytes"] > MAX_BYTES and _entries:
+            _, (_, old_size) = _entries.popitem(last=False)
+            _stats["bytes"] -= old_size
+            _stats["evictions"] += 1
+
+
+def _count(name, outcome):
+    with _lock:
+        _stats[outcome] += 1
+        counters = _stats["functions"].setdefault(name, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+    setattr(_thread, outcome, getattr(_thread, outcome, 0) + 1)
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+# ----------------------------------
+# Slå op i cachen eller beregn – også til værdier der ikke er et funktionskald
+# ----------------------------------
+def remember(name, key, compute, copy=True):
+    cache_key = (name, key)
+    found, value = _get(cache_key)
+    if found:
+        _count(name, "hits")
+    else:
+        _count(name, "misses")
+        value = compute()
+        _put(cache_key, value)
+    return _copy_result(value) if copy else value
+
+
+def data_fingerprint(*values):
+    # Indholdshash af DataFrames, Series, arrays og simple parametre
+    sha = hashlib.sha1()
+    for value in values:
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            labels = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+            sha.update(repr((type(value).__name__, value.shape, labels)).encode())
+            try:
+                sha.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+            except TypeError:
+                sha.update(value.to_csv().encode())
+        elif isinstance(value, np.ndarray):
+            sha.update(repr((value.dtype.str, value.shape)).encode())
+            sha.update(np.ascontiguousarray(value).tobytes())
+        else:
+            sha.update(repr(_freeze(value)).encode())
+        sha.update(b"|")
+    return sha.hexdigest()
+
+
+# ----------------------------------
+# Memoiser en loader i hele processen (også uden for Streamlit).
+#   key:   bygger en eksplicit nøgle ud fra kaldets argumenter
+#   files: returnerer de datafiler resultatet afhænger af – ændres en
+#          fils mtime eller størrelse, beregnes resultatet igen
+# ----------------------------------
+def memoize(key=None, files=None, copy=True):
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Positionelle og navngivne kald giver samme nøgle
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = bound.arguments
+
+            call_key = key(**call_args) if key else _freeze(call_args)
+            file_states = tuple(_file_state(p) for p in files(**call_args)) if files else ()
+
+            return remember(name, (call_key, file_states), lambda: func(*args, **kwargs), copy=copy)
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    with _lock:
+        return {
+            "hits": _stats["hits"],
+            "misses": _stats["misses"],
+            "evictions": _stats["evictions"],
+            "entries": len(_entries),
+            "bytes": _stats["bytes"],
+            "max_bytes": MAX_BYTES,
+            "functions": {name: dict(c) for name, c in _stats["functions"].items()},
+        }
+
+
+def thread_cache_stats():
+    # Kun opslag fra den kaldende tråd, så andre sessioners trafik ikke tælles med
+    return {"hits": getattr(_thread, "hits", 0), "misses": getattr(_thread, "misses", 0)}
+
+
+def clear_cache():
+    with _lock:
+        _entries.clear()
+        _stats["bytes"] = 0
@@ -0,0 +1,125 @@
+import os
+import time
+import functools
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+from utils.memo_cache import cache_stats, thread_cache_stats
+
+# Panelet kan også slås til uden klik, fx PERF_PANEL=1 streamlit run main_app.py
+PANEL_DEFAULT = os.environ.get("PERF_PANEL", "") not in ("", "0")
+
+# Hver Streamlit-session kører sit script i sin egen tråd
+_local = threading.local()
+
+# Ekstra linjer til panelet fra andre moduler (fx chatbotten), så perf ikke
+# selv skal importere dem. navn -> funktion der returnerer en tekst
+_panel_stats = {}
+
+
+def register_panel_stats(name, provider):
+    _panel_stats[name] = provider
+
+
+# ----------------------------------
+# Målinger pr. rerun
+# ----------------------------------
+def start_rerun():
+    _local.started = time.perf_counter()
+    _local.spans = {}   # navn -> [kald, total, egen tid]
+    _local.stack = []
+    _local.cache_before = thread_cache_stats()
+
+
+def _record(name, elapsed, child_time):
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        return
+    entry = spans.setdefault(name, [0, 0.0, 0.0])
+    entry[0] += 1
+    entry[1] += elapsed
+    entry[2] += elapsed - child_time
+
+
+@contextmanager
+def span(name):
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        yield
+        return
+
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        child_time = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        _record(name, elapsed, child_time)
+
+
+def timed(name=None):
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def rerun_summary():
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        return None
+
+    rows = [
+        {"Span": name, "Calls": calls, "Total (ms)": total * 1000, "Self (ms)": own * 1000}
+        for name, (calls, total, own) in spans.items()
+    ]
+    table = pd.DataFrame(rows, columns=["Span", "Calls", "Total (ms)", "Self (ms)"])
+    table = table.sort_values("Total (ms)", ascending=False).reset_index(drop=True)
+
+    # Træf/miss for denne sessions tråd; størrelsen er fælles for hele processen
+    before, after, shared = _local.cache_before, thread_cache_stats(), cache_stats()
+    return {
+        "total_ms": (time.perf_counter() - _local.started) * 1000,
+        "spans": table,
+        "cache_hits": after["hits"] - before["hits"],
+        "cache_misses": after["misses"] - before["misses"],
+        "cache_entries": shared["entries"],
+        "cache_mb": shared["bytes"] / (1024 * 1024),
+    }
+
+
+# ----------------------------------
+# Sidebar-panel med tider for det aktuelle rerun
+# ----------------------------------
+def show_performance_panel(top=15):
+    if not st.sidebar.checkbox("⏱️ Performance", value=PANEL_DEFAULT, key="perf_panel"):
+        return
+
+    summary = rerun_summary()
+    if summary is None:
+        return
+
+    with st.sidebar:
+        st.markdown("### ⏱️ Performance")
+        st.metric("Rerun total", f"{summary['total_ms']:.0f} ms")
+        col1, col2 = st.columns(2)
+        col1.metric("Cache hits", summary["cache_hits"])
+        col2.metric("Cache misses", summary["cache_misses"])
+        # Resten er fælles for alle sessioner i processen
+        st.caption(f"Memo cache (all sessions): {summary['cache_entries']} entries, {summary['cache_mb']:.1f} MB")
+        for provider in list(_panel_stats.values()):
+            st.caption(provider())
+        st.dataframe(
+            summary["spans"].head(top).style.format({"Total (ms)": "{:.1f}", "Self (ms)": "{:.1f}"}),
+            hide_index=True,
+        )
@@ -0,0 +1,42 @@
+import numpy as np
+from numpy.polynomial import polynomial as P
+
+
+# ----------------------------------
+# Fælles polynomiel trend for forecast-visningerne.
+# x-aksen (år, kvartalsnumre) centreres og skaleres til [-1, 1], så fx 2023^5
+# ikke ødelægger præcisionen. Polynomiets søjler er indlejrede (grad d = de
+# første d+1 søjler), så én QR-faktorisering giver løsningen for hver grad og
+# for alle y-søjler på én gang.
+# ----------------------------------
+def fit_trend(x, y, max_degree):
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(y, dtype=float)
+    centre = (x.max() + x.min()) / 2
+    scale = (x.max() - x.min()) / 2 or 1.0
+    t = (x - centre) / scale
+
+    V = P.polyvander(t, max_degree)
+    coefs = {}
+    if len(t) > max_degree:
+        Q, R = np.linalg.qr(V)
+        QtY = Q.T @ Y
+        diag = np.abs(np.diag(R))
+        tol = diag.max() * len(t) * np.finfo(float).eps
+    for degree in range(1, max_degree + 1):
+        cols = degree + 1
+        if len(t) > max_degree and (diag[:cols] > tol).all():
+            coefs[degree] = np.linalg.solve(R[:cols, :cols], QtY[:cols])
+        else:
+            # For få punkter til graden – mindste-norm-løsning som LinearRegression giver
+            coefs[degree] = np.linalg.lstsq(V[:, :cols], Y, rcond=None)[0]
+    return {"centre": centre, "scale": scale, "coefs": coefs}
+
+
+def predict_trend(fit, x, degree, column=None):
+    # column vælger én y-søjle, når der er fittet flere på én gang
+    coefs = fit["coefs"][degree]
+    if column is not None:
+        coefs = coefs[:, column]
+    t = (np.asarray(x, dtype=float) - fit["centre"]) / fit["scale"]
+    return P.polyval(t, coefs)
@@ -0,0 +1,355 @@
+import os
+import json
+import threading
+from bisect import bisect_left
+
+import pandas as pd
+from utils.excel_cache import CACHE_DIR, read_excel
+
+SALARY_DIR = "Data/Salary"
+SALARY_SHEET = "LONS30"
+
+GROUP_FOLDERS = {
+    "All": ("Stats all 13 - 23 salary", "all"),
+    "Men": ("Stats All men 13 - 23 salary", "men"),
+    "Women": ("Stats All women 13 - 23 salary", "women"),
+}
+
+CUBE_PATH = os.path.join(os.path.dirname(CACHE_DIR) or ".", "salary_cube.parquet")
+
+CUBE_COLUMNS = ["group", "year", "category", "category_norm", "row", "sector", "sector_pos", "value", "source"]
+
+
+def salary_file_path(group, year):
+    folder, prefix = GROUP_FOLDERS.get(group, GROUP_FOLDERS["Women"])
+    return os.path.join(SALARY_DIR, folder, f"{prefix} {year}.xlsx")
+
+
+def list_salary_files():
+    files = []
+    for group, (folder, prefix) in GROUP_FOLDERS.items():
+        folder_path = os.path.join(SALARY_DIR, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for file in sorted(os.listdir(folder_path)):
+            if file.startswith(prefix + " ") and file.endswith(".xlsx"):
+                year = file.split()[1].split(".")[0]
+                if year.isdigit():
+                    files.append((group, int(year), os.path.join(folder_path, file)))
+    return files
+
+
+def normalize_label(text):
+    return " ".join(str(text).split()).lower()
+
+
+def _to_number(x):
+    if isinstance(x, str):
+        x = x.replace(",", ".").replace("–", "").replace("...", "").strip()
+    return pd.to_numeric(x, errors="coerce")
+
+
+# ----------------------------------
+# Find layout i ét LONS30-ark og returner tidy rækker
+# ----------------------------------
+def parse_salary_workbook(file_path):
+    df = read_excel(file_path, sheet_name=SALARY_SHEET, header=None)
+
+    # Sektor-rækken er den første række med "Sektorer i alt"
+    header_row = None
+    for idx, row in df.iterrows():
+        if any(isinstance(v, str) and normalize_label(v) == "sektorer i alt" for v in row):
+            header_row = idx
+            break
+    if header_row is None:
+        raise ValueError(f"No sector header row found in {file_path}")
+
+    sector_cols = [c for c in df.columns if pd.notna(df.at[header_row, c])]
+    # Lønkategorien står lige til venstre for første sektor (kolonne 2 før 2023, kolonne 3 i 2023)
+    label_col = df.columns[df.columns.get_loc(sector_cols[0]) - 1]
+    sectors = [str(df.at[header_row, c]).strip() for c in sector_cols]
+
+    records = []
+    for idx in df.index[df.index > header_row]:
+        label = df.at[idx, label_col]
+        if not isinstance(label, str) or not label.strip():
+            continue
+        cells = df.loc[idx, sector_cols]
+        if cells.isna().all():
+            continue
+        for pos, (sector, cell) in enumerate(zip(sectors, cells)):
+            records.append({
+                "category": label.strip(),
+                "category_norm": normalize_label(label),
+                "row": int(idx),
+                "sector": sector,
+                "sector_pos": pos,
+                "value": float(_to_number(cell)),
+            })
+    return pd.DataFrame(records, columns=CUBE_COLUMNS[2:-1])
+
+
+# ----------------------------------
+# Byg kuben gruppe for gruppe (11 projektmapper pr. gruppe).
+# Parses i samme proces og én ad gangen: openpyxl holder GIL'en, så tråde
+# hjælper ikke, og målt koster en kold gruppe ~0,23 s i processen mod ~3,7 s
+# med fire spawn-processer, der hver selv skal importere pandas.
+# ----------------------------------
+def _parse_or_none(file_path):
+    try:
+        return parse_salary_workbook(file_path)
+    except Exception as e:
+        print(f"Fejl under indlæsning af {file_path}: {e}")
+        return None
+
+
+def build_salary_cube(groups=None):
+    files = [f for f in list_salary_files() if groups is None or f[0] in groups]
+    parts = [_parse_or_none(file_path) for _, _, file_path in files]
+
+    frames = []
+    for (group, year, file_path), part in zip(files, parts):
+        if part is None:
+            continue
+        part.insert(0, "year", year)
+        part.insert(0, "group", group)
+        part["source"] = os.path.normpath(file_path)
+        frames.append(part)
+
+    if not frames:
+        return pd.DataFrame(columns=CUBE_COLUMNS).set_index(["group", "year", "category_norm"])
+
+    cube = pd.concat(frames, ignore_index=True)[CUBE_COLUMNS]
+    return cube.set_index(["group", "year", "category_norm"]).sort_index()
+
+
+def _files_fingerprint(group):
+    fingerprint = []
+    for g, year, file_path in list_salary_files():
+        if g == group:
+            stat = os.stat(file_path)
+            fingerprint.append([g, year, stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def _cube_path(group):
+    return CUBE_PATH.replace(".parquet", f"_{GROUP_FOLDERS[group][1]}.parquet")
+
+
+def _read_group_cube(group, fingerprint):
+    path = _cube_path(group)
+    try:
+        with open(path + ".json", encoding="utf-8") as f:
+            if json.load(f) == fingerprint:
+                return pd.read_parquet(path)
+    except (OSError, ValueError, ImportError):
+        pass
+    return None
+
+
+def _write_group_cube(group, cube, fingerprint):
+    # Atomisk: parquet først via temp-fil, json-sidevognen sidst. Et nedbrud
+    # undervejs efterlader højst en gammel sidevogn, der ikke matcher.
+    path = _cube_path(group)
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        cube.to_parquet(path + ".tmp")
+        os.replace(path + ".tmp", path)
+        with open(path + ".json.tmp", "w", encoding="utf-8") as f:
+            json.dump(fingerprint, f)
+        os.replace(path + ".json.tmp", path + ".json")
+    except (OSError, ImportError, ValueError):
+        pass  # kuben virker stadig i hukommelsen
+
+
+_cube_lock = threading.RLock()
+_group_cubes = {}          # gruppe -> (fingerprint, kube)
+_cube = None
+_cube_key = None
+# Opslagsindekset læses uden lås: det bygges færdigt som et nyt objekt og
+# udgives med én tildeling, så en anden session aldrig ser et halvt indeks
+_index = {"workbooks": {}, "by_source": {}, "labels": {}}
+_trigram_index = None
+
+
+def _index_group(group, cube):
+    global _index
+    workbooks = {k: v for k, v in _index["workbooks"].items() if k[0] != group}
+    labels = {k: v for k, v in _index["labels"].items() if k[0] != group}
+    for (g, year), part in cube.groupby(level=["group", "year"], sort=False):
+        part = part.droplevel(["group", "year"]).sort_values(["row", "sector_pos"])
+        workbooks[(g, year)] = part
+        labels[(g, year)] = build_label_index(part)
+    by_source = {part["source"].iloc[0]: part for part in workbooks.values()}
+    _index = {"workbooks": workbooks, "by_source": by_source, "labels": labels}
+
+
+def load_group(group):
+    # Kun den ønskede gruppes projektmapper – et koldt trend-diagram parser 11 filer, ikke 33
+    with _cube_lock:
+        fingerprint = _files_fingerprint(group)
+        cached = _group_cubes.get(group)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        cube = _read_group_cube(group, fingerprint)
+        if cube is None:
+            cube = build_salary_cube([group])
+            _write_group_cube(group, cube, fingerprint)
+
+        _index_group(group, cube)
+        _group_cubes[group] = (fingerprint, cube)
+        return cube
+
+
+def get_salary_cube():
+    global _cube, _cube_key, _trigram_index
+    with _cube_lock:
+        cubes = [load_group(group) for group in GROUP_FOLDERS]
+        key = tuple(id(cube) for cube in cubes)
+        if _cube is None or key != _cube_key:
+            _cube = pd.concat(cubes).sort_index()
+            _trigram_index = build_trigram_index(_cube.index.unique(level="category_norm"))
+            _cube_key = key
+        return _cube
+
+
+# ----------------------------------
+# Label-indeks pr. projektmappe: normaliseret tekst -> rækkepositioner
+# ----------------------------------
+def build_label_index(part):
+    labels = dict(zip(part["row"], part.index))
+    rows = {}
+    for row, label in labels.items():
+        words = label.split()
+        # Alle ord-suffikser indekseres, så "timefortjeneste" også finder "standardberegnet timefortjeneste"
+        for i in range(len(words)):
+            rows.setdefault(" ".join(words[i:]), set()).add(row)
+    return {
+        "labels": labels,
+        "rows": {key: sorted(r) for key, r in rows.items()},
+        "keys": sorted(rows),
+        # Trigram-indeks over kun denne projektmappes kategorier – til forslag
+        "trigrams": build_trigram_index(labels.values()),
+    }
+
+
+def lookup_label(label_index, query, exact=False):
+    query = normalize_label(query)
+    if exact:
+        return [r for r in label_index["rows"].get(query, []) if label_index["labels"][r] == query]
+
+    # Præfiks-opslag i de sorterede nøgler
+    keys = label_index["keys"]
+    found = set()
+    for key in keys[bisect_left(keys, query):]:
+        if not key.startswith(query):
+            break
+        found.update(label_index["rows"][key])
+    return sorted(found)
+
+
+# ----------------------------------
+# Trigram-indeks over alle lønkategorier (alle år og grupper)
+# ----------------------------------
+def trigrams(text):
+    grams = set()
+    for word in normalize_label(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def build_trigram_index(labels):
+    labels = sorted(set(labels))
+    postings = {}
+    sizes = []
+    for label_id, label in enumerate(labels):
+        grams = trigrams(label)
+        sizes.append(len(grams))
+        for gram in grams:
+            postings.setdefault(gram, []).append(label_id)
+    return {"labels": labels, "sizes": sizes, "postings": postings}
+
+
+def fuzzy_categories(query, limit=5, candidates=None, min_score=0.3, trigram_index=None):
+    if trigram_index is None:
+        get_salary_cube()
+        trigram_index = _trigram_index
+    query_grams = trigrams(query)
+    if not query_grams or trigram_index is None:
+        return []
+
+    shared = {}
+    for gram in query_grams:
+        for label_id in trigram_index["postings"].get(gram, ()):
+            shared[label_id] = shared.get(label_id, 0) + 1
+
+    # Dice-score: 2 * fælles / (antal i query + antal i label)
+    scored = []
+    for label_id, count in shared.items():
+        label = trigram_index["labels"][label_id]
+        if candidates is not None and label not in candidates:
+            continue
+        score = 2 * count / (len(query_grams) + trigram_index["sizes"][label_id])
+        if score >= min_score:
+            scored.append((-score, label))
+    return [label for _, label in sorted(scored)[:limit]]
+
+
+def suggest_categories(label_index, query, limit=5):
+    suggestions = fuzzy_categories(query, limit=limit, trigram_index=label_index["trigrams"])
+
+    # Suppler med præfiks-træf på første ord
+    words = normalize_label(query).split()
+    if words and len(suggestions) < limit:
+        for row in lookup_label(label_index, words[0]):
+            label = label_index["labels"][row]
+            if label not in suggestions:
+                suggestions.append(label)
+    return suggestions[:limit]
+
+
+# ----------------------------------
+# Opslag i kuben
+# ----------------------------------
+def workbook_slice(group, year):
+    if group in GROUP_FOLDERS:
+        load_group(group)
+    return _index["workbooks"].get((group, int(year)))
+
+
+def workbook_label_index(group, year):
+    if group in GROUP_FOLDERS:
+        load_group(group)
+    return _index["labels"].get((group, int(year)))
+
+
+def available_years(group):
+    if group in GROUP_FOLDERS:
+        load_group(group)
+    return sorted(year for g, year in _index["workbooks"] if g == group)
+
+
+def workbook_slice_for_path(file_path):
+    file_path = os.path.normpath(file_path)
+    for group, (folder, _) in GROUP_FOLDERS.items():
+        if os.path.normpath(os.path.join(SALARY_DIR, folder)) == os.path.dirname(file_path):
+            load_group(group)
+    return _index["by_source"].get(file_path)
+
+
+def find_category(part, wage_category, exact=False, label_index=None):
+    if label_index is None:
+        label_index = build_label_index(part)
+
+    rows = lookup_label(label_index, wage_category, exact=True)
+    if not rows and not exact:
+        rows = lookup_label(label_index, wage_category)
+    if not rows:
+        return None
+
+    # Ved flere træf bruges første forekomst i arket
+    first_row = rows[0]
+    match_rows = part.loc[[label_index["labels"][first_row]]]
+    return match_rows[match_rows["row"] == first_row]
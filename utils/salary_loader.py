@@ -1,55 +1,40 @@
 import pandas as pd
 import os
+from utils.memo_cache import memoize
+from utils.perf import timed
+from utils.salary_cube import salary_file_path, list_salary_files, available_years, workbook_slice, workbook_label_index, find_category, suggest_categories
 
+@timed("load: salary data")
+@memoize(
+    key=lambda group, year, wage_category: (group, str(year), wage_category),
+    files=lambda group, year, wage_category: [salary_file_path(group, year)],
+)
 def load_salary_data(group, year, wage_category):
-    base_dir = "Data/Salary"
-    if group == "All":
-        folder = "Stats all 13 - 23 salary"
-        prefix = "all"
-    elif group == "Men":
-        folder = "Stats All men 13 - 23 salary"
-        prefix = "men"
-    else:
-        folder = "Stats All women 13 - 23 salary"
-        prefix = "women"
-
-    file_path = os.path.join(base_dir, folder, f"{prefix} {year}.xlsx")
+    file_path = salary_file_path(group, year)
     if not os.path.exists(file_path):
         return None, f"❌ File not found: {file_path}"
 
     try:
-        df = pd.read_excel(file_path, sheet_name="LONS30", header=None)
-        df = df.dropna(how="all").dropna(axis=1, how="all")
+        # Alle projektmapper er parset på forhånd i løn-kuben
+        part = workbook_slice(group, year)
+        if part is None:
+            return None, f"❌ Error while reading file: could not parse {file_path}"
 
+        label_index = workbook_label_index(group, year)
         wage_category_clean = wage_category.lower().strip()
 
-        # Søg lønkategori i hele arket, fleksibelt
-        match_row = df[df.apply(lambda row: row.astype(str).str.lower().str.contains(wage_category_clean).any(), axis=1)]
-        if match_row.empty:
-            all_text = df.apply(lambda row: row.astype(str).str.lower(), axis=1).stack().unique()
-            suggestions = [s for s in all_text if wage_category_clean.split()[0] in s][:5]
+        # Slå lønkategorien op i arkets label-indeks, fleksibelt
+        match_rows = find_category(part, wage_category_clean, label_index=label_index)
+        if match_rows is None:
+            suggestions = suggest_categories(label_index, wage_category_clean)
             return None, f"⚠️ '{wage_category}' not found. Suggestions:\n- " + "\n- ".join(suggestions)
 
-        # Hent første match og forsøg at finde værdier i kolonne 3–7 (ofte der tallene ligger)
-        row = match_row.iloc[0]
-        values = row[3:8]
-
-        # Rens ikke-numeriske symboler som “–”, “...”, mm.
-        values = values.apply(lambda x: str(x).replace(",", ".").replace("–", "").replace("...", "").strip())
-        values_numeric = pd.to_numeric(values, errors="coerce")
-
+        values_numeric = match_rows["value"]
         if values_numeric.isnull().any():
             return None, "❌ Non-numeric or missing values in wage data."
 
-        # Forsøg at finde sektorer – enten fra række 2 eller ved fallback
-        try:
-            sectors = df.loc[2, 3:8].tolist()
-            sectors = [s if pd.notna(s) else f"Sektor {i+1}" for i, s in enumerate(sectors)]
-        except:
-            sectors = [f"Sektor {i+1}" for i in range(5)]
-
         df_result = pd.DataFrame({
-            "Sektor": sectors,
+            "Sektor": match_rows["sector"].tolist(),
             "Timefortjeneste (kr)": values_numeric.round(0).tolist()
         })
 
@@ -57,3 +42,31 @@ def load_salary_data(group, year, wage_category):
 
     except Exception as e:
         return None, f"❌ Error while reading file: {e}"
+
+
+@timed("load: salary series")
+@memoize(files=lambda group, **kwargs: [path for g, year, path in list_salary_files() if g == group])
+def load_salary_series(group, wage_category, years=None, rounded=True):
+    # Gennemsnitlig timeløn på tværs af sektorer pr. år i ét kald.
+    # Første kald parser kun gruppens egne projektmapper (11 filer, én ad gangen –
+    # se utils.salary_cube); derefter læses de fra cachen.
+    if years is None:
+        years = available_years(group)
+
+    values = {}
+    for year in years:
+        part = workbook_slice(group, year)
+        if part is None:
+            continue
+        match_rows = find_category(part, wage_category, label_index=workbook_label_index(group, year))
+        if match_rows is None or match_rows["value"].isnull().any():
+            continue
+        wages = match_rows["value"].round(0) if rounded else match_rows["value"]
+        values[year] = wages.mean()
+
+    if not values:
+        return None, f"⚠️ No salary data found for '{wage_category}' ({group})."
+
+    series = pd.Series(values, dtype=float, name="Timefortjeneste (kr)")
+    series.index.name = "År"
+    return series, None